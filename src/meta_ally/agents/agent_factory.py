@@ -172,8 +172,11 @@ class AgentFactory:
             require_human_approval: Whether to require human approval for non-read-only operations
             approval_callback: Optional callback for human approval
         """
+        # Collect the requested group enum types once instead of scanning the groups per API
+        requested_types = {type(g) for g in tool_groups}
+
         # Check if we need AI Knowledge tools
-        needs_ai_knowledge = any(isinstance(g, AIKnowledgeToolGroup) for g in tool_groups)
+        needs_ai_knowledge = AIKnowledgeToolGroup in requested_types
         if needs_ai_knowledge and not self.tool_manager._ai_knowledge_tools:  # noqa: SLF001
             self.logger.info("Auto-loading AI Knowledge tools...")
             self.setup_ai_knowledge_tools(
@@ -182,7 +185,7 @@ class AgentFactory:
             )
 
         # Check if we need Ally Config tools
-        needs_ally_config = any(isinstance(g, AllyConfigToolGroup) for g in tool_groups)
+        needs_ally_config = AllyConfigToolGroup in requested_types
         if needs_ally_config and not self.tool_manager._ally_config_tools:  # noqa: SLF001
             self.logger.info("Auto-loading Ally Config tools...")
             self.setup_ally_config_tools(
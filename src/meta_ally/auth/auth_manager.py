@@ -7,6 +7,7 @@ the ai_core.authorization module.
 
 import base64
 import json
+import time
 from datetime import datetime
 from typing import Any
 
@@ -39,6 +40,7 @@ class AuthManager:
 
         self._token: str | None = None
         self._expiration: Any = None  # Can be datetime, timestamp (float), or str depending on ai_core implementation
+        self._expires_at: float | None = None  # POSIX timestamp of _expiration, computed once per refresh
 
     def get_token(self, force_refresh: bool = False) -> str:
         """
@@ -68,21 +70,34 @@ class AuthManager:
         Returns:
             True if the token needs to be refreshed, False otherwise
         """
-        if self._token is None or self._expiration is None:
+        if self._token is None or self._expires_at is None:
             return True
 
-        # Refresh if token expires within 5 minutes
-        now = datetime.now()
+        return self._expires_at <= time.time()
 
-        # Handle both timestamp (float) and datetime objects
-        if isinstance(self._expiration, (int, float)):
-            # Convert timestamp to datetime for comparison
-            expiration_dt = datetime.fromtimestamp(self._expiration)
-        else:
-            # Assume it's already a datetime object
-            expiration_dt = self._expiration
+    @staticmethod
+    def _to_timestamp(expiration: Any) -> float | None:
+        """
+        Convert a token expiration to a POSIX timestamp
+
+        Args:
+            expiration: Expiration as returned by ai_core, a timestamp, a datetime or an ISO 8601 string
 
-        return expiration_dt <= now
+        Returns:
+            The expiration as a POSIX timestamp, or None if there is no usable expiration
+            (the token is then refreshed on every use)
+        """
+        if isinstance(expiration, str):
+            try:
+                expiration = datetime.fromisoformat(expiration)
+            except ValueError:
+                return None
+        if isinstance(expiration, (int, float)):
+            return float(expiration)
+        if isinstance(expiration, datetime):
+            # Naive datetimes are local time, as datetime.now() is
+            return expiration.timestamp()
+        return None
 
     def _refresh_token(self) -> None:
         """Refresh the authorization token"""
@@ -93,6 +108,7 @@ class AuthManager:
             client_id=self.client_id,
             should_open_browser=self.should_open_browser
         )
+        self._expires_at = self._to_timestamp(self._expiration)
         print(f"Token obtained, expires at: {self._expiration}")
 
     def get_auth_header(self) -> dict[str, str]:
@@ -69,8 +69,7 @@ class APITestHookLibrary(HookLibrary):
         if self._tool_manager is None:
             self._tool_manager = ToolGroupManager(self._auth_manager)
             # Load both API tools
-            self._tool_manager.load_ai_knowledge_tools()
-            self._tool_manager.load_ally_config_tools()
+            self._tool_manager.load_all_tools()
         return self._tool_manager
 
     def register_hooks(self) -> None:
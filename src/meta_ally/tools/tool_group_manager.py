@@ -9,14 +9,76 @@ Based on the tool categorization patterns found in the AI Knowledge and Ally Con
 from __future__ import annotations
 
 import json
+import logging
+import re
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from itertools import chain
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from pydantic_ai import Tool
 
 from ..auth.auth_manager import AuthManager
-from ..lib.openapi_to_tools import OpenAPIToolDependencies, OpenAPIToolsLoader
+
+# Imported where needed at runtime: meta_ally.lib pulls in the agents package, which imports this module
+if TYPE_CHECKING:
+    from ..lib.openapi_to_tools import (
+        OpenAPIToolDependencies,
+        OpenAPIToolsLoader,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Default OpenAPI spec locations of the two APIs
+_AI_KNOWLEDGE_OPENAPI_URL = "https://backend-api.test.ai-knowledge.aws.inform-cloud.io/openapi.json"
+_ALLY_CONFIG_OPENAPI_URL = "https://ally-config-ui.test.copilot.aws.inform-cloud.io/openapi.json"
+
+
+class _KeywordMatcher:
+    """
+    Matches names against prioritized keyword rules with a single compiled regex alternation.
+
+    Alternatives are ordered by rule priority and wrapped in a zero-width lookahead, so one scan
+    reports the highest-priority keyword at every position, overlapping matches included. The
+    lowest rule index over all positions is the first rule that a rule-by-rule substring check
+    would have matched.
+    """
+
+    def __init__(self, rules: tuple[tuple[Enum, tuple[str, ...]], ...]):
+        """Compile the rules, given as (group, keywords) pairs in priority order."""
+        self._groups = tuple(group for group, _keywords in rules)
+        self._priority: dict[str, int] = {}
+        for index, (_group, keywords) in enumerate(rules):
+            for keyword in keywords:
+                self._priority.setdefault(keyword, index)
+        # A keyword containing another keyword of the same or a higher-priority rule can never
+        # decide the result (e.g. "sources" next to "source"), so leave it out of the alternation
+        self._priority = {
+            keyword: index
+            for keyword, index in self._priority.items()
+            if not any(
+                other != keyword and other in keyword and other_index <= index
+                for other, other_index in self._priority.items()
+            )
+        }
+        # Dicts keep insertion order, so the alternation follows rule priority
+        self._pattern = re.compile("(?=({}))".format("|".join(map(re.escape, self._priority))))
+
+    def match(self, name_lower: str) -> Enum | None:
+        """
+        Find the group of the first rule with a keyword contained in the name.
+
+        Returns:
+            The matching group, or None if no keyword occurs in the name
+        """
+        priority = min(
+            (self._priority[match.group(1)] for match in self._pattern.finditer(name_lower)),
+            default=None,
+        )
+        return None if priority is None else self._groups[priority]
 
 
 class AIKnowledgeToolGroup(Enum):
@@ -32,6 +94,24 @@ class AIKnowledgeToolGroup(Enum):
     ALL = "all"                           # All available tools
 
 
+# Categorizable AI Knowledge groups and their tag lookup (enum values double as OpenAPI tags)
+_AI_KNOWLEDGE_GROUPS = tuple(group for group in AIKnowledgeToolGroup if group is not AIKnowledgeToolGroup.ALL)
+_AI_KNOWLEDGE_TAG_TO_GROUP = {group.value: group for group in _AI_KNOWLEDGE_GROUPS}
+
+# Name patterns used as fallback when a tool has no usable tag, in priority order (first group wins)
+_AI_KNOWLEDGE_NAME_PATTERNS = (
+    (AIKnowledgeToolGroup.SOURCES, ("source", "sources")),
+    (AIKnowledgeToolGroup.DOCUMENTS, ("document", "documents", "doc")),
+    (AIKnowledgeToolGroup.COLLECTIONS, ("collection", "collections")),
+    (AIKnowledgeToolGroup.PERMISSIONS, ("permission", "permissions", "access", "auth", "role", "acl")),
+    (AIKnowledgeToolGroup.STATUS, ("status", "health")),
+    (AIKnowledgeToolGroup.CONNECTIONS, ("connection", "connections")),
+    (AIKnowledgeToolGroup.INFO, ("info", "models", "test")),
+    (AIKnowledgeToolGroup.INDEX_RUNS, ("index", "indexing", "reindex", "index-run", "index_run")),
+)
+_AI_KNOWLEDGE_PATTERN_MATCHER = _KeywordMatcher(_AI_KNOWLEDGE_NAME_PATTERNS)
+
+
 class AllyConfigToolGroup(Enum):
     """Tool groups for Ally Config API based on OpenAPI tags"""
     INFO = "info"                         # Portal configuration and capabilities
@@ -45,12 +125,98 @@ class AllyConfigToolGroup(Enum):
     ALL = "all"                           # All available tools
 
 
+# Categorizable Ally Config groups and their tag lookup (enum values double as OpenAPI tags)
+_ALLY_CONFIG_GROUPS = tuple(group for group in AllyConfigToolGroup if group is not AllyConfigToolGroup.ALL)
+_ALLY_CONFIG_TAG_TO_GROUP = {group.value: group for group in _ALLY_CONFIG_GROUPS}
+
+# Fallback categorization rules with exact tool name mappings (based on notebook analysis), in priority order
+_ALLY_CONFIG_RULES = (
+    # Info / Portal info
+    (AllyConfigToolGroup.INFO, ("get_portal_config", "list_models", "list_scopes")),
+
+    # Copilot operations (management, metadata)
+    (AllyConfigToolGroup.COPILOTS, (
+        "list_copilots", "create_copilot", "delete_copilot",
+        "get_copilot_metadata", "update_copilot_metadata",
+    )),
+
+    # Configuration
+    (AllyConfigToolGroup.CONFIGURATION, (
+        "get_copilot_config", "update_copilot_config", "validate_copilot_config", "get_copilot_config_history",
+    )),
+
+    # Server Authorization
+    (AllyConfigToolGroup.SERVER_AUTHORIZATION, (
+        "get_copilot_authorization", "update_copilot_authorization", "delete_copilot_authorization"
+    )),
+
+    # Evaluation (suites management + execution)
+    (AllyConfigToolGroup.EVALUATION, (
+        "list_copilot_evaluation_suites", "get_copilot_evaluation_suite",
+        "create_copilot_evaluation_suite", "update_copilot_evaluation_suite",
+        "get_copilot_evaluation_suite_history", "add_copilot_evaluation_test_cases",
+        "execute_copilot_evaluation_suite", "get_copilot_evaluation_results"
+    )),
+
+    # Logs and analytics operations
+    (AllyConfigToolGroup.LOGS, (
+        "get_copilot_logs",
+        "get_copilot_cost_graph", "get_copilot_cost_daily",
+        "get_copilot_ratings",
+        "get_copilot_sessions",
+        "upload_file_to_s3"
+    )),
+
+    # Permissions (role-based access control)
+    (AllyConfigToolGroup.PERMISSIONS, (
+        "get_permissions", "add_role", "remove_role",
+        "grant_permission", "revoke_permission", "add_user", "remove_user"
+    )),
+)
+
+# Exact operation id -> group lookup; an exact match takes precedence over keyword matches of earlier rules
+# (rules are applied in reverse so the first rule listing an identifier wins)
+_ALLY_CONFIG_EXACT_TO_GROUP: dict[str, AllyConfigToolGroup] = {
+    identifier: group
+    for group, identifiers in reversed(_ALLY_CONFIG_RULES)
+    for identifier in identifiers
+}
+
+# Identifiers long enough to be used as keywords in the substring fallback, filtered once per rule
+_ALLY_CONFIG_KEYWORD_MATCHER = _KeywordMatcher(tuple(
+    (group, tuple(identifier for identifier in identifiers if len(identifier) > 3))
+    for group, identifiers in _ALLY_CONFIG_RULES
+))
+
+
 ToolGroupType = AIKnowledgeToolGroup | AllyConfigToolGroup
 
 
+@dataclass(slots=True)
+class _ToolContext:
+    """Minimal stand-in for a RunContext when calling tool functions directly"""
+    deps: OpenAPIToolDependencies
+
+
 class ToolGroupManager:
     """Manages tool groups and organizes tools from OpenAPI loaders"""
 
+    __slots__ = (
+        "_ai_knowledge_groups",
+        "_ai_knowledge_loader",
+        "_ai_knowledge_signature",
+        "_ai_knowledge_tools",
+        "_ally_config_groups",
+        "_ally_config_loader",
+        "_ally_config_signature",
+        "_ally_config_tools",
+        "_auth_manager",
+        "_available_groups_cache",
+        "_dependencies_cache",
+        "_operation_index",
+        "_replaced_tool_names",
+    )
+
     def __init__(self, auth_manager: AuthManager):
         """Initialize the ToolGroupManager with an AuthManager instance."""
         self._auth_manager = auth_manager
@@ -60,39 +226,121 @@ class ToolGroupManager:
         self._ally_config_groups: dict[AllyConfigToolGroup, list] = {}
         self._ai_knowledge_loader: OpenAPIToolsLoader | None = None
         self._ally_config_loader: OpenAPIToolsLoader | None = None
+        self._dependencies_cache: dict[OpenAPIToolsLoader, OpenAPIToolDependencies] = {}
+        self._available_groups_cache: dict[str, dict[str, list[str]]] | None = None
+        self._operation_index: dict[str, tuple[OpenAPIToolsLoader, Tool]] = {}
+        self._replaced_tool_names: set[str] = set()
+        self._ai_knowledge_signature: tuple | None = None
+        self._ally_config_signature: tuple | None = None
 
     def load_ai_knowledge_tools(
         self,
-        openapi_url: str = "https://backend-api.test.ai-knowledge.aws.inform-cloud.io/openapi.json",
+        openapi_url: str = _AI_KNOWLEDGE_OPENAPI_URL,
         models_filename: str = "ai_knowledge_api_models.py",
         regenerate_models: bool = True,
         require_human_approval: bool = False,
         approval_callback: Callable | None = None
     ) -> None:
         """Load AI Knowledge API tools and organize them into groups"""
-        self._ai_knowledge_loader = OpenAPIToolsLoader(
-            openapi_url=openapi_url,
-            models_filename=models_filename,
-            regenerate_models=regenerate_models,
-            require_human_approval=require_human_approval,
-            approval_callback=approval_callback,
-            tool_name_prefix="ai_knowledge_",
-            max_response_chars=20000  # 20k chars generous limit for AI Knowledge responses
+        loader = self._create_ai_knowledge_loader(
+            openapi_url, models_filename, regenerate_models, require_human_approval, approval_callback
         )
-
-        self._ai_knowledge_tools = self._ai_knowledge_loader.load_tools()
-        self._organize_ai_knowledge_tools()
+        self._set_ai_knowledge_tools(loader, loader.load_tools())
+        self._rebuild_operation_index()
 
     def load_ally_config_tools(
         self,
-        openapi_url: str = "https://ally-config-ui.test.copilot.aws.inform-cloud.io/openapi.json",
+        openapi_url: str = _ALLY_CONFIG_OPENAPI_URL,
         models_filename: str = "ally_config_api_models.py",
         regenerate_models: bool = True,
         require_human_approval: bool = False,
         approval_callback: Callable | None = None
     ) -> None:
         """Load Ally Config API tools and organize them into groups"""
-        self._ally_config_loader = OpenAPIToolsLoader(
+        loader = self._create_ally_config_loader(
+            openapi_url, models_filename, regenerate_models, require_human_approval, approval_callback
+        )
+        self._set_ally_config_tools(loader, loader.load_tools())
+        self._rebuild_operation_index()
+
+    def load_all_tools(
+        self,
+        regenerate_models: bool = True,
+        require_human_approval: bool = False,
+        approval_callback: Callable | None = None
+    ) -> None:
+        """
+        Load the AI Knowledge and Ally Config tools from their default OpenAPI URLs concurrently.
+
+        Fetching a spec and generating its models is network and subprocess bound, so both loaders
+        run in worker threads. Categorization and indexing happen afterwards on the calling thread.
+
+        Args:
+            regenerate_models: Whether to regenerate the Pydantic models from the specs
+            require_human_approval: Whether to require human approval for non-read-only operations
+            approval_callback: Optional callback for human approval
+        """
+        ai_knowledge_loader = self._create_ai_knowledge_loader(
+            _AI_KNOWLEDGE_OPENAPI_URL, "ai_knowledge_api_models.py",
+            regenerate_models, require_human_approval, approval_callback
+        )
+        ally_config_loader = self._create_ally_config_loader(
+            _ALLY_CONFIG_OPENAPI_URL, "ally_config_api_models.py",
+            regenerate_models, require_human_approval, approval_callback
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ai_knowledge_future = executor.submit(ai_knowledge_loader.load_tools)
+            ally_config_future = executor.submit(ally_config_loader.load_tools)
+            ai_knowledge_tools = ai_knowledge_future.result()
+            ally_config_tools = ally_config_future.result()
+
+        self._set_ai_knowledge_tools(ai_knowledge_loader, ai_knowledge_tools)
+        self._set_ally_config_tools(ally_config_loader, ally_config_tools)
+        self._rebuild_operation_index()
+
+    @staticmethod
+    def _create_ai_knowledge_loader(
+        openapi_url: str,
+        models_filename: str,
+        regenerate_models: bool,
+        require_human_approval: bool,
+        approval_callback: Callable | None,
+    ) -> OpenAPIToolsLoader:
+        """
+        Create the OpenAPI loader for the AI Knowledge API.
+
+        Returns:
+            The configured loader, with its tools not loaded yet
+        """
+        from ..lib.openapi_to_tools import OpenAPIToolsLoader  # noqa: PLC0415
+
+        return OpenAPIToolsLoader(
+            openapi_url=openapi_url,
+            models_filename=models_filename,
+            regenerate_models=regenerate_models,
+            require_human_approval=require_human_approval,
+            approval_callback=approval_callback,
+            tool_name_prefix="ai_knowledge_",
+            max_response_chars=20000  # 20k chars generous limit for AI Knowledge responses
+        )
+
+    @staticmethod
+    def _create_ally_config_loader(
+        openapi_url: str,
+        models_filename: str,
+        regenerate_models: bool,
+        require_human_approval: bool,
+        approval_callback: Callable | None,
+    ) -> OpenAPIToolsLoader:
+        """
+        Create the OpenAPI loader for the Ally Config API.
+
+        Returns:
+            The configured loader, with its tools not loaded yet
+        """
+        from ..lib.openapi_to_tools import OpenAPIToolsLoader  # noqa: PLC0415
+
+        return OpenAPIToolsLoader(
             openapi_url=openapi_url,
             models_filename=models_filename,
             regenerate_models=regenerate_models,
@@ -102,197 +350,185 @@ class ToolGroupManager:
             max_response_chars=20000  # 20k chars generous limit for Ally Config responses
         )
 
-        self._ally_config_tools = self._ally_config_loader.load_tools()
+    def _set_ai_knowledge_tools(self, loader: OpenAPIToolsLoader, tools: list) -> None:
+        """Install freshly loaded AI Knowledge tools and organize them into groups."""
+        if self._ai_knowledge_loader is not None:
+            self._dependencies_cache.pop(self._ai_knowledge_loader, None)
+        # Freshly loaded tools replace any mock functions applied to the previous ones
+        self._replaced_tool_names = {
+            name for name in self._replaced_tool_names if not name.startswith(loader.tool_name_prefix)
+        }
+        self._ai_knowledge_loader = loader
+        self._ai_knowledge_tools = tools
+        self._organize_ai_knowledge_tools()
+
+    def _set_ally_config_tools(self, loader: OpenAPIToolsLoader, tools: list) -> None:
+        """Install freshly loaded Ally Config tools and organize them into groups."""
+        if self._ally_config_loader is not None:
+            self._dependencies_cache.pop(self._ally_config_loader, None)
+        # Freshly loaded tools replace any mock functions applied to the previous ones
+        self._replaced_tool_names = {
+            name for name in self._replaced_tool_names if not name.startswith(loader.tool_name_prefix)
+        }
+        self._ally_config_loader = loader
+        self._ally_config_tools = tools
         self._organize_ally_config_tools()
 
-    def _categorize_by_tag(self, tool, tag_to_group: dict) -> bool:
+    @staticmethod
+    def _categorization_signature(loader: OpenAPIToolsLoader | None, tools: list) -> tuple:
+        """
+        Summarize everything categorization depends on: tool names and their OpenAPI tags
+
+        Returns:
+            Tuple of (tool name, tags) pairs in tool order
+        """
+        if loader is None:
+            return tuple((tool.name, ()) for tool in tools)
+        return tuple((tool.name, tuple(loader.get_tags_for_tool(tool.name))) for tool in tools)
+
+    def _categorize_by_tag(self, tool, tag_to_group: dict) -> AIKnowledgeToolGroup | None:
         """
         Try to categorize a tool by its OpenAPI tags.
 
         Returns:
-            True if the tool was successfully categorized, False otherwise.
+            The matching group, or None if the tool could not be categorized.
         """
         if not self._ai_knowledge_loader:
-            return False
+            return None
 
         tags = self._ai_knowledge_loader.get_tags_for_tool(tool.name)
         if tags:
-            first_tag = tags[0].lower()
-            if first_tag in tag_to_group:
-                group = tag_to_group[first_tag]
-                self._ai_knowledge_groups[group].append(tool)
-                return True
-        return False
-
-    def _categorize_by_patterns(self, tool, name_lower: str) -> None:
-        """Categorize a tool by name patterns as fallback."""
-        patterns_map = {
-            AIKnowledgeToolGroup.SOURCES: ["source", "sources"],
-            AIKnowledgeToolGroup.DOCUMENTS: ["document", "documents", "doc"],
-            AIKnowledgeToolGroup.COLLECTIONS: ["collection", "collections"],
-            AIKnowledgeToolGroup.PERMISSIONS: ["permission", "permissions", "access", "auth", "role", "acl"],
-            AIKnowledgeToolGroup.STATUS: ["status", "health"],
-            AIKnowledgeToolGroup.CONNECTIONS: ["connection", "connections"],
-            AIKnowledgeToolGroup.INFO: ["info", "models", "test"],
-            AIKnowledgeToolGroup.INDEX_RUNS: ["index", "indexing", "reindex", "index-run", "index_run"],
-        }
+            return tag_to_group.get(tags[0].lower())
+        return None
 
-        for group, patterns in patterns_map.items():
-            if any(pattern in name_lower for pattern in patterns):
-                self._ai_knowledge_groups[group].append(tool)
-                break
+    def _categorize_by_patterns(self, name_lower: str) -> AIKnowledgeToolGroup | None:
+        """
+        Categorize a tool by name patterns as fallback.
+
+        Returns:
+            The first group whose patterns match, or None if nothing matches.
+        """
+        return _AI_KNOWLEDGE_PATTERN_MATCHER.match(name_lower)
 
     def _organize_ai_knowledge_tools(self) -> None:
         """Organize AI Knowledge tools into logical groups based on tags first, then notebook patterns"""
-        # Initialize groups
-        for group in AIKnowledgeToolGroup:
-            if group != AIKnowledgeToolGroup.ALL:
-                self._ai_knowledge_groups[group] = []
+        signature = self._categorization_signature(self._ai_knowledge_loader, self._ai_knowledge_tools)
+        if signature == self._ai_knowledge_signature:
+            # Same names and tags as the last categorization: only point the groups at the current tool objects
+            self._update_group_references(self._ai_knowledge_groups, self._ai_knowledge_tools)
+            return
 
-        # Create tag to group lookup (using enum values as tags)
-        tag_to_group = {group.value: group for group in AIKnowledgeToolGroup if group != AIKnowledgeToolGroup.ALL}
+        # Collect into local buckets and swap them in once categorization is complete
+        buckets: dict[AIKnowledgeToolGroup, list] = {group: [] for group in _AI_KNOWLEDGE_GROUPS}
 
         for tool in self._ai_knowledge_tools:
-            name_lower = tool.name.lower()
-
             # First, try to categorize by OpenAPI tags
-            categorized = self._categorize_by_tag(tool, tag_to_group)
+            group = self._categorize_by_tag(tool, _AI_KNOWLEDGE_TAG_TO_GROUP)
 
-            # Fallback to pattern matching if not categorized by tags
-            if not categorized:
-                self._categorize_by_patterns(tool, name_lower)
+            # Fallback to pattern matching if not categorized by tags (only lowercase when needed)
+            if group is None:
+                group = self._categorize_by_patterns(tool.name.lower())
 
-    def _categorize_ally_tool_by_tag(self, tool, tag_to_group: dict) -> bool:
+            if group is not None:
+                buckets[group].append(tool)
+
+        self._ai_knowledge_groups = buckets
+        self._ai_knowledge_signature = signature
+        self._available_groups_cache = None
+
+    def _categorize_ally_tool_by_tag(self, tool, tag_to_group: dict) -> AllyConfigToolGroup | None:
         """
         Try to categorize an Ally Config tool by its OpenAPI tags.
 
         Returns:
-            True if the tool was successfully categorized, False otherwise.
+            The matching group, or None if the tool could not be categorized.
         """
         if not self._ally_config_loader:
-            return False
+            return None
 
         tags = self._ally_config_loader.get_tags_for_tool(tool.name)
         if not tags:
-            return False
-
-        first_tag = tags[0]  # Keep original case for matching
-        if first_tag not in tag_to_group:
-            return False
+            return None
 
-        group = tag_to_group[first_tag]
-        self._ally_config_groups[group].append(tool)
-        return True
+        return tag_to_group.get(tags[0])  # Keep original case for matching
 
-    def _categorize_ally_tool_by_rules(self, tool, categorization_rules: list) -> bool:
+    def _categorize_ally_tool_by_rules(self, tool) -> AllyConfigToolGroup | None:
         """
         Categorize an Ally Config tool using categorization rules.
 
         Returns:
-            True if the tool was successfully categorized, False otherwise.
+            The matching group, or None if no rule applies.
         """
-        tool_name_without_prefix = tool.name.replace("ally_config_", "")
-
-        for category, identifiers in categorization_rules:
-            # Check if tool name exactly matches any identifier (with or without prefix)
-            if tool_name_without_prefix in identifiers or tool.name in identifiers:
-                self._ally_config_groups[category].append(tool)
-                return True
+        tool_name_without_prefix = tool.name.removeprefix("ally_config_")
 
-            # Otherwise check if any identifier keyword is in the tool name
-            if any(identifier in tool.name.lower() for identifier in identifiers if len(identifier) > 3):
-                self._ally_config_groups[category].append(tool)
-                return True
+        # Check if tool name exactly matches any identifier. Identifiers never carry the prefix,
+        # so a single probe with the stripped name also covers tools loaded without a prefix.
+        group = _ALLY_CONFIG_EXACT_TO_GROUP.get(tool_name_without_prefix)
+        if group is not None:
+            return group
 
-        return False
+        # Otherwise check if any identifier keyword is in the tool name
+        return _ALLY_CONFIG_KEYWORD_MATCHER.match(tool.name.lower())
 
     def _organize_ally_config_tools(self) -> None:
         """Organize Ally Config tools into logical groups based on tags first, then notebook patterns"""
-        # Initialize groups
-        for group in AllyConfigToolGroup:
-            if group != AllyConfigToolGroup.ALL:
-                self._ally_config_groups[group] = []
-
-        # Create tag to group lookup (using enum values as tags)
-        tag_to_group = {group.value: group for group in AllyConfigToolGroup if group != AllyConfigToolGroup.ALL}
-
-        # Define categorization rules with exact tool name mappings (based on notebook analysis) - used as fallback
-        categorization_rules = [
-            # Info / Portal info
-            (AllyConfigToolGroup.INFO, ["get_portal_config", "list_models", "list_scopes"]),
-
-            # Copilot operations (management, metadata)
-            (AllyConfigToolGroup.COPILOTS, [
-                "list_copilots", "create_copilot", "delete_copilot",
-                "get_copilot_metadata", "update_copilot_metadata",
-            ]),
-
-            # Configuration
-            (AllyConfigToolGroup.CONFIGURATION, [
-                "get_copilot_config", "update_copilot_config", "validate_copilot_config", "get_copilot_config_history",
-            ]),
-
-            # Server Authorization
-            (AllyConfigToolGroup.SERVER_AUTHORIZATION, [
-                "get_copilot_authorization", "update_copilot_authorization", "delete_copilot_authorization"
-            ]),
-
-            # Evaluation (suites management + execution)
-            (AllyConfigToolGroup.EVALUATION, [
-                "list_copilot_evaluation_suites", "get_copilot_evaluation_suite",
-                "create_copilot_evaluation_suite", "update_copilot_evaluation_suite",
-                "get_copilot_evaluation_suite_history", "add_copilot_evaluation_test_cases",
-                "execute_copilot_evaluation_suite", "get_copilot_evaluation_results"
-            ]),
-
-            # Logs and analytics operations
-            (AllyConfigToolGroup.LOGS, [
-                "get_copilot_logs",
-                "get_copilot_cost_graph", "get_copilot_cost_daily",
-                "get_copilot_ratings",
-                "get_copilot_sessions",
-                "upload_file_to_s3"
-            ]),
-
-            # Permissions (role-based access control)
-            (AllyConfigToolGroup.PERMISSIONS, [
-                "get_permissions", "add_role", "remove_role",
-                "grant_permission", "revoke_permission", "add_user", "remove_user"
-            ]),
-        ]
+        signature = self._categorization_signature(self._ally_config_loader, self._ally_config_tools)
+        if signature == self._ally_config_signature:
+            # Same names and tags as the last categorization: only point the groups at the current tool objects
+            self._update_group_references(self._ally_config_groups, self._ally_config_tools)
+            return
+
+        # Collect into local buckets and swap them in once categorization is complete
+        buckets: dict[AllyConfigToolGroup, list] = {group: [] for group in _ALLY_CONFIG_GROUPS}
 
         for tool in self._ally_config_tools:
             # First, try to categorize by OpenAPI tags
-            categorized = self._categorize_ally_tool_by_tag(tool, tag_to_group)
+            group = self._categorize_ally_tool_by_tag(tool, _ALLY_CONFIG_TAG_TO_GROUP)
 
             # Fallback to pattern matching if not categorized by tags
-            if not categorized:
-                self._categorize_ally_tool_by_rules(tool, categorization_rules)
+            if group is None:
+                group = self._categorize_ally_tool_by_rules(tool)
 
             # Tools not matched will remain uncategorized (no default group added)
+            if group is not None:
+                buckets[group].append(tool)
+
+        self._ally_config_groups = buckets
+        self._ally_config_signature = signature
+        self._available_groups_cache = None
 
     def get_tools_for_groups(self, tool_groups: list[ToolGroupType]) -> list:
         """
         Get all tools for the specified tool groups
 
+        Tools that belong to more than one requested group (for example when
+        ALL is combined with a sub-group) are only returned once.
+
         Returns:
             List of tools from the specified groups
         """
-        all_tools = []
-
-        for group in tool_groups:
-            if isinstance(group, AIKnowledgeToolGroup):
-                if group == AIKnowledgeToolGroup.ALL:
-                    all_tools.extend(self._ai_knowledge_tools)
-                else:
-                    all_tools.extend(self._ai_knowledge_groups.get(group, []))
-            elif isinstance(group, AllyConfigToolGroup):
-                if group == AllyConfigToolGroup.ALL:
-                    all_tools.extend(self._ally_config_tools)
-                else:
-                    all_tools.extend(self._ally_config_groups.get(group, []))
-
-        return all_tools
+        # Map each group enum type to (all tools, per-group tools, ALL sentinel)
+        lookup = {
+            AIKnowledgeToolGroup: (self._ai_knowledge_tools, self._ai_knowledge_groups, AIKnowledgeToolGroup.ALL),
+            AllyConfigToolGroup: (self._ally_config_tools, self._ally_config_groups, AllyConfigToolGroup.ALL),
+        }
+        # Ordered set of requested groups; requesting the same group twice must not duplicate its tools
+        requested = dict.fromkeys(tool_groups)
+        sources = []
+
+        for group in requested:
+            entry = lookup.get(type(group))
+            if entry is None:
+                continue
+            all_tools, groups, all_group = entry
+            if group is all_group:
+                sources.append(all_tools)
+            elif all_group not in requested:
+                # Sub-groups are skipped when ALL of the same API is requested, since ALL already covers them
+                sources.append(groups.get(group, ()))
+
+        # Buckets of one API are disjoint and tool names are API-prefixed, so the sources never overlap
+        return list(chain.from_iterable(sources))
 
     def create_dependencies(
         self,
@@ -304,29 +540,52 @@ class ToolGroupManager:
         Returns:
             OpenAPIToolDependencies instance configured with the auth manager
         """
+        from ..lib.openapi_to_tools import OpenAPIToolDependencies  # noqa: PLC0415
+
         if auth_manager is None:
             auth_manager = self._auth_manager
         return OpenAPIToolDependencies(auth_manager=auth_manager)
 
+    def _get_loader_dependencies(self, loader: OpenAPIToolsLoader) -> OpenAPIToolDependencies:
+        """
+        Get the cached dependencies for a loader, creating them on first use
+
+        The cached instance is only reused while it is still bound to the current
+        auth manager, so swapping the auth manager never hands out stale credentials.
+        It is shared by all calls to the loader's generated tool functions, which only
+        read ``ctx.deps``; tools replaced via apply_tool_replacements get a fresh instance.
+
+        Returns:
+            OpenAPIToolDependencies bound to this manager's auth manager
+        """
+        dependencies = self._dependencies_cache.get(loader)
+        if dependencies is None or dependencies.auth_manager is not self._auth_manager:
+            dependencies = loader.create_dependencies(auth_manager=self._auth_manager)
+            self._dependencies_cache[loader] = dependencies
+        return dependencies
+
     def get_available_groups(self) -> dict[str, dict[str, list[str]]]:
         """
         Get information about available tool groups and their tools
 
+        The result is built once per categorization and cached, since group
+        membership and tool names only change when tools are (re)loaded.
+        Treat the returned dictionary as read-only.
+
         Returns:
             Dictionary mapping API names to their groups and associated tool names
         """
-        info = {
-            "ai_knowledge_groups": {},
-            "ally_config_groups": {}
-        }
-
-        for group, tools in self._ai_knowledge_groups.items():
-            info["ai_knowledge_groups"][group.value] = [tool.name for tool in tools]
-
-        for group, tools in self._ally_config_groups.items():
-            info["ally_config_groups"][group.value] = [tool.name for tool in tools]
+        if self._available_groups_cache is None:
+            self._available_groups_cache = {
+                "ai_knowledge_groups": {
+                    group.value: [tool.name for tool in tools] for group, tools in self._ai_knowledge_groups.items()
+                },
+                "ally_config_groups": {
+                    group.value: [tool.name for tool in tools] for group, tools in self._ally_config_groups.items()
+                },
+            }
 
-        return info
+        return self._available_groups_cache
 
     def get_ai_knowledge_tool_by_operation_id(self, operation_id: str):
         """
@@ -356,6 +615,39 @@ class ToolGroupManager:
             raise ValueError("Ally Config tools not loaded. Call load_ally_config_tools() first.")
         return self._ally_config_loader.get_tool_by_operation_id(operation_id)
 
+    def _rebuild_operation_index(self) -> None:
+        """Index all loaded tools by their unprefixed operation ID, mapping to (loader, tool)"""
+        index: dict[str, tuple[OpenAPIToolsLoader, Tool]] = {}
+        # Ally Config tools take precedence, matching the lookup order of get_tool_by_operation_id
+        for loader in (self._ally_config_loader, self._ai_knowledge_loader):
+            if loader is None:
+                continue
+            prefix = loader.tool_name_prefix
+            for tool in loader.tools:
+                index.setdefault(tool.name.removeprefix(prefix), (loader, tool))
+        self._operation_index = index
+
+    def _find_tool_with_loader(self, operation_id: str) -> tuple[OpenAPIToolsLoader, Tool] | None:
+        """
+        Find a tool by operation ID together with the loader that owns it
+
+        Returns:
+            Tuple of (loader, tool) if found, None otherwise
+        """
+        found = self._operation_index.get(operation_id)
+        if found is not None:
+            return found
+
+        # Truncated tool names are not keyed by their original operation ID, so defer to the loaders
+        for loader in (self._ally_config_loader, self._ai_knowledge_loader):
+            if loader is None:
+                continue
+            tool = loader.get_tool_by_operation_id(operation_id)
+            if tool is not None:
+                return loader, tool
+
+        return None
+
     def get_tool_by_operation_id(self, operation_id: str):
         """
         Get a tool by operation ID from either AI Knowledge or Ally Config APIs
@@ -367,20 +659,10 @@ class ToolGroupManager:
             The tool if found, None otherwise
 
         Note:
-            Searches AI Knowledge tools first, then Ally Config tools
+            Searches Ally Config tools first, then AI Knowledge tools
         """
-        # Try Ally Config tools first
-        if self._ally_config_loader is not None:
-            tool = self._ally_config_loader.get_tool_by_operation_id(operation_id)
-            if tool is not None:
-                return tool
-        # Try AI Knowledge tools
-        if self._ai_knowledge_loader is not None:
-            tool = self._ai_knowledge_loader.get_tool_by_operation_id(operation_id)
-            if tool is not None:
-                return tool
-
-        return None
+        found = self._find_tool_with_loader(operation_id)
+        return found[1] if found is not None else None
 
     def apply_tool_replacements(
         self,
@@ -424,49 +706,44 @@ class ToolGroupManager:
         """
         replaced_count = 0
 
-        # Separate replacements by prefix
-        ai_knowledge_replacements = {}
-        ally_config_replacements = {}
+        # Prefix -> (replacement bucket, tool list, group dict, API name for logging)
+        dispatch = {
+            "ai_knowledge_": ({}, self._ai_knowledge_tools, self._ai_knowledge_groups, "AI Knowledge"),
+            "ally_config_": ({}, self._ally_config_tools, self._ally_config_groups, "Ally Config"),
+        }
         unknown_replacements = []
 
+        # Separate replacements by prefix in a single pass
         for tool_name, new_function in tool_replacements.items():
-            if tool_name.startswith("ai_knowledge_"):
-                ai_knowledge_replacements[tool_name] = new_function
-            elif tool_name.startswith("ally_config_"):
-                ally_config_replacements[tool_name] = new_function
+            for prefix, (bucket, *_rest) in dispatch.items():
+                if tool_name.startswith(prefix):
+                    bucket[tool_name] = new_function
+                    break
             else:
                 unknown_replacements.append(tool_name)
 
         # Warn about unknown prefixes
         if unknown_replacements:
-            print(f"  ⚠️  Warning: {len(unknown_replacements)} tool name(s) without recognized prefix:")
-            for tool_name in unknown_replacements:
-                print(f"      • {tool_name} (expected 'ai_knowledge_' or 'ally_config_' prefix)")
-
-        # Apply replacements to AI Knowledge tools
-        if ai_knowledge_replacements:
-            replaced_count += self._replace_in_tool_list(
-                self._ai_knowledge_tools, ai_knowledge_replacements, "AI Knowledge"
-            )
-            # Also update group references
-            self._update_group_references(
-                self._ai_knowledge_groups, self._ai_knowledge_tools
+            logger.warning(
+                "%d tool name(s) without recognized prefix (expected 'ai_knowledge_' or 'ally_config_'): %s",
+                len(unknown_replacements),
+                ", ".join(unknown_replacements),
             )
 
-        # Apply replacements to Ally Config tools
-        if ally_config_replacements:
-            replaced_count += self._replace_in_tool_list(
-                self._ally_config_tools, ally_config_replacements, "Ally Config"
-            )
+        # Apply replacements per API, skipping APIs without any replacement
+        for bucket, tools, groups, api_name in dispatch.values():
+            if not bucket:
+                continue
+            replaced_count += self._replace_in_tool_list(tools, bucket, api_name)
             # Also update group references
-            self._update_group_references(
-                self._ally_config_groups, self._ally_config_tools
-            )
+            self._update_group_references(groups, tools)
 
         if replaced_count == 0:
-            print("  ⚠️  Warning: No tools were replaced. Check that tool names match loaded tools.")
+            logger.warning("No tools were replaced. Check that tool names match loaded tools.")
         else:
-            print(f"  ✓ Successfully replaced {replaced_count} tool function(s)")
+            # Replaced tools are new objects, so the index must point at them
+            self._rebuild_operation_index()
+            logger.info("Successfully replaced %d tool function(s)", replaced_count)
 
     def _replace_in_tool_list(
         self,
@@ -488,23 +765,26 @@ class ToolGroupManager:
             Number of tools replaced
         """
         replaced_count = 0
-        for tool_name, new_function in tool_replacements.items():
-            for idx, tool in enumerate(tools):
-                if tool.name == tool_name:
-                    # Create a new tool with the same properties but new function
-                    new_tool = Tool.from_schema(
-                        function=new_function,
-                        name=tool.name,
-                        description=tool.description,
-                        json_schema=tool.tool_def.parameters_json_schema,
-                        takes_ctx=tool.takes_ctx
-                    )
-
-                    # Replace the tool in the list
-                    tools[idx] = new_tool
-                    replaced_count += 1
-                    print(f"  ✓ Replaced {api_name} tool: {tool.name}")
-                    break  # Move to next replacement after finding match
+        # Single pass over the tools with a hashed lookup per tool name
+        for idx, tool in enumerate(tools):
+            new_function = tool_replacements.get(tool.name)
+            if new_function is None:
+                continue
+
+            # Create a new tool with the same properties but new function
+            new_tool = Tool.from_schema(
+                function=new_function,
+                name=tool.name,
+                description=tool.description,
+                json_schema=tool.tool_def.parameters_json_schema,
+                takes_ctx=tool.takes_ctx
+            )
+
+            # Replace the tool in the list
+            tools[idx] = new_tool
+            self._replaced_tool_names.add(tool.name)
+            replaced_count += 1
+            logger.info("Replaced %s tool: %s", api_name, tool.name)
         return replaced_count
 
     def _update_group_references(
@@ -571,7 +851,7 @@ class ToolGroupManager:
         # Apply AI Knowledge descriptions
         if ai_knowledge_json_path:
             if not self._ai_knowledge_tools:
-                print("  ⚠️  Warning: AI Knowledge tools not loaded. Call load_ai_knowledge_tools() first.")
+                logger.warning("AI Knowledge tools not loaded. Call load_ai_knowledge_tools() first.")
             else:
                 updated_count += self._apply_descriptions_from_json(
                     json_path=ai_knowledge_json_path,
@@ -584,7 +864,7 @@ class ToolGroupManager:
         # Apply Ally Config descriptions
         if ally_config_json_path:
             if not self._ally_config_tools:
-                print("  ⚠️  Warning: Ally Config tools not loaded. Call load_ally_config_tools() first.")
+                logger.warning("Ally Config tools not loaded. Call load_ally_config_tools() first.")
             else:
                 updated_count += self._apply_descriptions_from_json(
                     json_path=ally_config_json_path,
@@ -595,9 +875,11 @@ class ToolGroupManager:
                 )
 
         if updated_count == 0:
-            print("  ⚠️  Warning: No tool descriptions were updated.")
+            logger.warning("No tool descriptions were updated.")
         else:
-            print(f"  ✓ Successfully updated {updated_count} tool description(s)")
+            # Updated tools are new objects, so the index must point at them
+            self._rebuild_operation_index()
+            logger.info("Successfully updated %d tool description(s)", updated_count)
 
     def _apply_descriptions_from_json(
         self,
@@ -622,14 +904,14 @@ class ToolGroupManager:
         """
         json_file = Path(json_path)
         if not json_file.exists():
-            print(f"  ⚠️  Warning: JSON file not found: {json_path}")
+            logger.warning("JSON file not found: %s", json_path)
             return 0
 
         try:
             with open(json_file, encoding="utf-8") as f:
                 data = json.load(f)
         except json.JSONDecodeError as e:
-            print(f"  ⚠️  Warning: Failed to parse JSON file {json_path}: {e}")
+            logger.warning("Failed to parse JSON file %s: %s", json_path, e)
             return 0
 
         # Extract improved descriptions keyed by operation ID (without prefix)
@@ -641,14 +923,14 @@ class ToolGroupManager:
                 improved_descriptions[operation_id] = new_description
 
         if not improved_descriptions:
-            print(f"  ⚠️  Warning: No valid tool descriptions found in {json_path}")
+            logger.warning("No valid tool descriptions found in %s", json_path)
             return 0
 
         # Update tools in the list
         updated_count = 0
         for idx, tool in enumerate(tools_list):
             # Strip prefix to get operation ID
-            operation_id = tool.name.replace(tool_prefix, "", 1)
+            operation_id = tool.name.removeprefix(tool_prefix)
 
             if operation_id in improved_descriptions:
                 new_description = improved_descriptions[operation_id]
@@ -665,7 +947,7 @@ class ToolGroupManager:
                 # Replace the tool in the list
                 tools_list[idx] = new_tool
                 updated_count += 1
-                print(f"  ✓ Updated {api_name} tool description: {tool.name}")
+                logger.info("Updated %s tool description: %s", api_name, tool.name)
 
         # Update group references to point to new tool instances
         if updated_count > 0:
@@ -686,42 +968,30 @@ class ToolGroupManager:
 
         Raises:
             ValueError: If the tool with the given operation_id is not found
-            ValueError: If dependencies cannot be created for the tool
         """
-        tool = self.get_tool_by_operation_id(operation_id)
-        if tool is None:
+        # Resolve the tool and its owning loader in a single lookup
+        found = self._find_tool_with_loader(operation_id)
+        if found is None:
             raise ValueError(f"Tool '{operation_id}' not found in loaded tools")
 
-        # Determine which loader to use for dependencies
-        dependencies = None
-        if self._ai_knowledge_loader is not None:
-            ai_tool = self._ai_knowledge_loader.get_tool_by_operation_id(operation_id)
-            if ai_tool is not None:
-                dependencies = self._ai_knowledge_loader.create_dependencies(auth_manager=self._auth_manager)
-
-        if dependencies is None and self._ally_config_loader is not None:
-            ally_tool = self._ally_config_loader.get_tool_by_operation_id(operation_id)
-            if ally_tool is not None:
-                dependencies = self._ally_config_loader.create_dependencies(auth_manager=self._auth_manager)
-
-        if dependencies is None:
-            raise ValueError(f"Could not create dependencies for tool '{operation_id}'")
-
-        # Create a simple context object with the required attributes
-        class SimpleContext:
-            def __init__(self, deps):
-                self.deps = deps
-
-        ctx = SimpleContext(dependencies)
+        loader, tool = found
+        if tool.name in self._replaced_tool_names:
+            # Replacement functions may modify ctx.deps, so they never share the cached instance
+            dependencies = loader.create_dependencies(auth_manager=self._auth_manager)
+        else:
+            dependencies = self._get_loader_dependencies(loader)
+        ctx = _ToolContext(dependencies)
 
         try:
-            print(f"🔄 Attempting to call: {tool.name}")
+            logger.debug("Calling %s", tool.name)
             result = await tool.function(ctx, **kwargs)  # type: ignore
-            print(f"✅ Success! Result type: {type(result)}")
+            logger.debug("Call to %s succeeded, result type: %s", tool.name, type(result).__name__)
             return result
 
         except Exception as e:
-            # API errors are handled gracefully - print warning and return None
-            error_msg = str(e) if str(e) else f"{type(e).__name__}: {e!r}"
-            print(f"⚠️ Error calling {tool.name}: {error_msg}")
+            # API errors are handled gracefully - log a warning (with traceback when debugging) and return None
+            error_msg = str(e) or f"{type(e).__name__}: {e!r}"
+            logger.warning(
+                "Error calling %s: %s", tool.name, error_msg, exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
             return None
@@ -4,6 +4,15 @@ Utilities for visualizing test cases and their variants.
 This module provides functions for displaying case comparisons using rich formatting.
 """
 
+from pydantic_ai.messages import (
+    RetryPromptPart,
+    SystemPromptPart,
+    TextPart,
+    ThinkingPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
 from pydantic_evals import Dataset
 from rich.columns import Columns
 from rich.console import Console
@@ -17,6 +26,106 @@ from ..agents.dependencies import TimelineEntryType
 # Default console with wider width for side-by-side display
 console = Console(width=200)
 
+# Shared status cells for summary tables (Text is not modified by rendering, so rows can reuse them)
+_STATUS_OK = Text("✓", style="green")
+_STATUS_FAILED = Text("✗", style="red")
+_HAS_EXPECTED = Text("✓", style="green")
+_NO_EXPECTED = Text("✗", style="dim")
+
+# Prebuilt titles of the per-message chat panels (Panel copies Text titles before styling them)
+_USER_TITLE = Text.from_markup("[bold bright_blue]👤 User[/bold bright_blue]")
+_ASSISTANT_TITLE = Text.from_markup("[bold magenta]🤖 Assistant[/bold magenta]")
+_ORCHESTRATOR_TITLE = Text.from_markup("[bold magenta]🎯 Orchestrator[/bold magenta]")
+
+# Banner rules printed around every case by visualize_single_case
+_CASE_RULE = f"[bold cyan]{'=' * 80}[/bold cyan]"
+_EXPECTED_OUTPUT_RULE = f"\n[bold magenta]{'─' * 80}[/bold magenta]"
+
+
+def _part_content(part) -> str:
+    """
+    Get the content of a message part as a string.
+
+    Returns:
+        The content, converted with str() unless it already is a string
+    """
+    content = part.content
+    if type(content) is not str:
+        content = str(content)
+    return content
+
+
+def _format_prompt_part(part) -> str:
+    """
+    Format a system or user prompt part, with its content below the part type.
+
+    Returns:
+        The formatted part
+    """
+    return f"[dim]{type(part).__name__}:[/dim]\n{_part_content(part)}"
+
+
+def _format_tool_return_part(part) -> str:
+    """
+    Format a tool return part.
+
+    Returns:
+        The formatted part
+    """
+    return f"[dim yellow]🔧 Tool Return:[/dim yellow]\n{_part_content(part)}"
+
+
+def _format_inline_content_part(part) -> str:
+    """
+    Format a content part (text, thinking, retry prompt) on a single line with its part type.
+
+    Returns:
+        The formatted part
+    """
+    return f"[dim]{type(part).__name__}:[/dim] {_part_content(part)}"
+
+
+def _format_tool_call_part(part) -> str:
+    """
+    Format a tool call part, with its arguments if there are any.
+
+    Returns:
+        The formatted part
+    """
+    if getattr(part, 'args', None):
+        return f"[bold yellow]🔧 Tool Call:[/bold yellow] {part.tool_name}\n[dim]Args:[/dim] {part.args}"
+    return f"[bold yellow]🔧 Tool Call:[/bold yellow] {part.tool_name}"
+
+
+def _format_other_part(part) -> str | None:
+    """
+    Format a part of a type without a dedicated formatter, based on its attributes.
+
+    Returns:
+        The formatted part, or None if the part has nothing to display
+    """
+    if hasattr(part, 'content'):
+        if type(part).__name__ in {'UserPromptPart', 'SystemPromptPart'}:
+            return _format_prompt_part(part)
+        if type(part).__name__ == 'ToolReturnPart':
+            return _format_tool_return_part(part)
+        return _format_inline_content_part(part)
+    if hasattr(part, 'tool_name'):
+        return _format_tool_call_part(part)
+    return None
+
+
+# Formatter per known part type; anything else falls back to attribute inspection
+_PART_FORMATTERS = {
+    SystemPromptPart: _format_prompt_part,
+    UserPromptPart: _format_prompt_part,
+    ToolReturnPart: _format_tool_return_part,
+    RetryPromptPart: _format_inline_content_part,
+    TextPart: _format_inline_content_part,
+    ThinkingPart: _format_inline_content_part,
+    ToolCallPart: _format_tool_call_part,
+}
+
 
 def format_message_parts(parts: list) -> str:
     """
@@ -28,24 +137,9 @@ def format_message_parts(parts: list) -> str:
     Returns:
         Formatted string representation of the parts
     """
-    output = []
-    for part in parts:
-        if hasattr(part, 'content'):
-            # UserPromptPart, SystemPromptPart, TextPart, or ToolReturnPart
-            part_type = type(part).__name__
-            content = part.content if isinstance(part.content, str) else str(part.content)
-            if part_type in {'UserPromptPart', 'SystemPromptPart'}:
-                output.append(f"[dim]{part_type}:[/dim]\n{content}")
-            elif part_type == 'ToolReturnPart':
-                output.append(f"[dim yellow]🔧 Tool Return:[/dim yellow]\n{content}")
-            else:
-                output.append(f"[dim]{part_type}:[/dim] {content}")
-        elif hasattr(part, 'tool_name'):
-            # ToolCallPart
-            output.append(f"[bold yellow]🔧 Tool Call:[/bold yellow] {part.tool_name}")
-            if hasattr(part, 'args') and part.args:
-                output.append(f"[dim]Args:[/dim] {part.args}")
-    return "\n".join(output)
+    get_formatter = _PART_FORMATTERS.get
+    formatted_parts = (get_formatter(type(part), _format_other_part)(part) for part in parts)
+    return "\n".join(text for text in formatted_parts if text is not None)
 
 
 def display_chat_message(
@@ -70,11 +164,11 @@ def display_chat_message(
     if msg_type == "ModelRequest":
         if agent_prefix:
             # Within specialist context, requests come from orchestrator (purple)
-            title = "[bold magenta]🎯 Orchestrator[/bold magenta]"
+            title = _ORCHESTRATOR_TITLE
             border = "magenta"
         else:
             # User messages (light blue)
-            title = "[bold bright_blue]👤 User[/bold bright_blue]"
+            title = _USER_TITLE
             border = "bright_blue"
         panel = Panel(
             content,
@@ -92,7 +186,7 @@ def display_chat_message(
             border = "green"
         else:
             # Single agent - purple
-            title = "[bold magenta]🤖 Assistant[/bold magenta]"
+            title = _ASSISTANT_TITLE
             border = "magenta"
         panel = Panel(
             content,
@@ -156,7 +250,7 @@ def display_orchestrator_message(
     if msg_type == "ModelRequest":
         panel = Panel(
             content,
-            title="[bold bright_blue]👤 User[/bold bright_blue]",
+            title=_USER_TITLE,
             border_style="bright_blue",
             padding=(1, 2),
             width=panel_width
@@ -165,7 +259,7 @@ def display_orchestrator_message(
     elif msg_type == "ModelResponse":
         panel = Panel(
             content,
-            title="[bold magenta]🎯 Orchestrator[/bold magenta]",
+            title=_ORCHESTRATOR_TITLE,
             border_style="magenta",
             padding=(1, 2),
             width=panel_width
@@ -202,9 +296,9 @@ def display_conversation_timeline(
 
 def _print_case_header(panel_title: str, output_console: Console) -> None:
     """Print the case header with title."""
-    output_console.print(f"\n[bold cyan]{'=' * 80}[/bold cyan]")
+    output_console.print(f"\n{_CASE_RULE}")
     output_console.print(f"[bold cyan]{panel_title}[/bold cyan]")
-    output_console.print(f"[bold cyan]{'=' * 80}[/bold cyan]\n")
+    output_console.print(f"{_CASE_RULE}\n")
 
 
 def _print_description(case, output_console: Console) -> None:
@@ -222,14 +316,16 @@ def _print_description(case, output_console: Console) -> None:
 
 def _print_messages(input_messages: list, panel_width: int, output_console: Console) -> None:
     """Print input messages in chat format."""
-    for _, msg in enumerate(input_messages):
+    # Assistant panels are right-aligned by the same left padding for every message
+    response_padding = (0, 0, 0, output_console.width - panel_width)
+    for msg in input_messages:
         msg_type = type(msg).__name__
         content = format_message_parts(msg.parts)
 
         if msg_type == "ModelRequest":
             panel = Panel(
                 content,
-                title="[bold bright_blue]👤 User[/bold bright_blue]",
+                title=_USER_TITLE,
                 border_style="bright_blue",
                 padding=(1, 2),
                 width=panel_width
@@ -238,14 +334,12 @@ def _print_messages(input_messages: list, panel_width: int, output_console: Cons
         elif msg_type == "ModelResponse":
             panel = Panel(
                 content,
-                title="[bold magenta]🤖 Assistant[/bold magenta]",
+                title=_ASSISTANT_TITLE,
                 border_style="magenta",
                 padding=(1, 2),
                 width=panel_width
             )
-            left_padding = output_console.width - panel_width
-            padded_panel = Padding(panel, (0, 0, 0, left_padding))
-            output_console.print(padded_panel)
+            output_console.print(Padding(panel, response_padding))
 
 
 def _format_expected_output(expected) -> str:
@@ -258,31 +352,31 @@ def _format_expected_output(expected) -> str:
     Returns:
         Formatted string representation of the expected output
     """
-    expected_text = ""
+    sections = []
 
     if hasattr(expected, 'output_message') and expected.output_message:
-        expected_text += "[bold cyan]Expected Message:[/bold cyan]\n"
-        expected_text += f"{expected.output_message}\n\n"
+        sections.append("[bold cyan]Expected Message:[/bold cyan]\n")
+        sections.append(f"{expected.output_message}\n\n")
 
     if hasattr(expected, 'tool_calls') and expected.tool_calls:
-        expected_text += "[bold green]Expected Tool Calls:[/bold green]\n"
+        sections.append("[bold green]Expected Tool Calls:[/bold green]\n")
         for i, tool_call in enumerate(expected.tool_calls, 1):
-            expected_text += f"  {i}. [yellow]🔧 {tool_call.tool_name}[/yellow]\n"
-            expected_text += f"     Args: {tool_call.args}\n"
-            expected_text += f"     ID: {tool_call.tool_call_id}\n"
-        expected_text += "\n"
+            sections.append(f"  {i}. [yellow]🔧 {tool_call.tool_name}[/yellow]\n")
+            sections.append(f"     Args: {tool_call.args}\n")
+            sections.append(f"     ID: {tool_call.tool_call_id}\n")
+        sections.append("\n")
 
     if hasattr(expected, 'model_messages') and expected.model_messages:
-        expected_text += "[bold yellow]Expected Model Messages:[/bold yellow]\n"
-        expected_text += format_message_history(expected.model_messages)
+        sections.append("[bold yellow]Expected Model Messages:[/bold yellow]\n")
+        sections.append(format_message_history(expected.model_messages))
 
-    return expected_text
+    return "".join(sections)
 
 
 def _print_expected_output(case, output_console: Console) -> None:
     """Print expected output if available."""
     if hasattr(case, 'expected_output') and case.expected_output:
-        output_console.print(f"\n[bold magenta]{'─' * 80}[/bold magenta]")
+        output_console.print(_EXPECTED_OUTPUT_RULE)
         expected_text = _format_expected_output(case.expected_output)
 
         if expected_text:
@@ -298,9 +392,7 @@ def _print_expected_output(case, output_console: Console) -> None:
 def _print_metadata(case, output_console: Console) -> None:
     """Print case metadata if available."""
     if hasattr(case, 'metadata') and case.metadata:
-        metadata_text = ""
-        for key, value in case.metadata.items():
-            metadata_text += f"[cyan]{key}:[/cyan] {value}\n"
+        metadata_text = "\n".join(f"[cyan]{key}:[/cyan] {value}" for key, value in case.metadata.items())
 
         metadata_panel = Panel(
             metadata_text.strip(),
@@ -326,16 +418,62 @@ def visualize_single_case(case,
     panel_width = int(output_console.width * 0.7)
 
     panel_title = title or getattr(case, 'name', 'Test Case')
-    _print_case_header(panel_title, output_console)
-    _print_description(case, output_console)
-
     input_messages = getattr(case, 'input_messages', None) or getattr(case, 'inputs', [])
-    _print_messages(input_messages, panel_width, output_console)
 
-    _print_expected_output(case, output_console)
-    _print_metadata(case, output_console)
+    # Buffer the whole case so it is written to the terminal in one go
+    with output_console:
+        _print_case_header(panel_title, output_console)
+        _print_description(case, output_console)
+        _print_messages(input_messages, panel_width, output_console)
+        _print_expected_output(case, output_console)
+        _print_metadata(case, output_console)
+        output_console.print()
 
-    output_console.print()
+
+def _format_history_content_part(part) -> str:
+    """
+    Format a part carrying content (prompts, text, thinking, tool returns) for the message history.
+
+    Returns:
+        The formatted part
+    """
+    return f"  [{type(part).__name__}]\n  {_part_content(part)}"
+
+
+def _format_history_tool_call_part(part) -> str:
+    """
+    Format a tool call part for the message history.
+
+    Returns:
+        The formatted part
+    """
+    return f"  [ToolCall] {part.tool_name}\n  Args: {part.args}"
+
+
+def _format_history_other_part(part) -> str | None:
+    """
+    Format a part of a type without a dedicated formatter, based on its attributes.
+
+    Returns:
+        The formatted part, or None if the part has nothing to display
+    """
+    if hasattr(part, 'content'):
+        return _format_history_content_part(part)
+    if hasattr(part, 'tool_name'):
+        return _format_history_tool_call_part(part)
+    return None
+
+
+# Formatter per known part type; anything else falls back to attribute inspection
+_HISTORY_PART_FORMATTERS = {
+    SystemPromptPart: _format_history_content_part,
+    UserPromptPart: _format_history_content_part,
+    ToolReturnPart: _format_history_content_part,
+    RetryPromptPart: _format_history_content_part,
+    TextPart: _format_history_content_part,
+    ThinkingPart: _format_history_content_part,
+    ToolCallPart: _format_history_tool_call_part,
+}
 
 
 def format_message_history(messages: list) -> str:
@@ -349,19 +487,12 @@ def format_message_history(messages: list) -> str:
         Formatted string representation of the message history
     """
     output = []
-    for i, msg in enumerate(messages):
-        output.append(f"[bold]Message {i + 1}:[/bold]")
-        for part in msg.parts:
-            if hasattr(part, 'content'):
-                # UserPromptPart, SystemPromptPart, or ToolReturnPart
-                part_type = type(part).__name__
-                content = part.content if isinstance(part.content, str) else str(part.content)
-                output.append(f"  [{part_type}]")
-                output.append(f"  {content}")
-            elif hasattr(part, 'tool_name'):
-                # ToolCallPart
-                output.append(f"  [ToolCall] {part.tool_name}")
-                output.append(f"  Args: {part.args}")
+    for i, msg in enumerate(messages, 1):
+        output.append(f"[bold]Message {i}:[/bold]")
+        formatted_parts = (
+            _HISTORY_PART_FORMATTERS.get(type(part), _format_history_other_part)(part) for part in msg.parts
+        )
+        output.extend(text for text in formatted_parts if text is not None)
         output.append("")
     return "\n".join(output)
 
@@ -403,9 +534,10 @@ def show_side_by_side_comparison(original_case,
     )
 
     # Display side by side with explicit configuration
-    output_console.print("\n")
-    output_console.print(Columns([original_panel, variant_panel], equal=False, expand=False, padding=(0, 2)))
-    output_console.print("\n")
+    with output_console:
+        output_console.print("\n")
+        output_console.print(Columns([original_panel, variant_panel], equal=False, expand=False, padding=(0, 2)))
+        output_console.print("\n")
 
 
 def create_summary_table(all_variants: dict, console_instance: Console | None = None):
@@ -427,45 +559,23 @@ def create_summary_table(all_variants: dict, console_instance: Console | None =
 
     for idx, (case_name, data) in enumerate(all_variants.items(), 1):
         num_variants = len(data['variants'])
-        status = "✓" if num_variants > 0 else "✗"
-        status_style = "green" if num_variants > 0 else "red"
 
         table.add_row(
             str(idx),
             case_name,
             str(num_variants),
-            Text(status, style=status_style)
+            _STATUS_OK if num_variants > 0 else _STATUS_FAILED
         )
 
-    output_console.print("\n")
-    output_console.print(table)
-    output_console.print("\n")
-
+    with output_console:
+        output_console.print("\n")
+        output_console.print(table)
+        output_console.print("\n")
 
-def visualize_dataset(dataset,
-                      show_details: bool = True,
-                      max_cases: int | None = None,
-                      console_instance: Console | None = None):
-    """
-    Visualize all cases in a dataset with an overview table and optional detailed views.
-
-    Args:
-        dataset: The dataset to visualize (pydantic_evals.Dataset or similar with .cases attribute)
-        show_details: If True, show detailed view of each case. If False, only show summary table.
-        max_cases: Optional limit on number of cases to visualize in detail (useful for large datasets)
-        console_instance: Optional Console instance to use (defaults to module console)
-    """
-    output_console = console_instance or console
-
-    # Get cases from dataset
-    cases = dataset.cases if hasattr(dataset, 'cases') else []
-
-    if not cases:
-        output_console.print("[yellow]⚠️  Dataset is empty - no cases to visualize[/yellow]")
-        return
 
+def _print_dataset_overview(dataset_name: str, cases: list, output_console: Console) -> None:
+    """Print the dataset header, overview table and statistics."""
     # Print dataset header
-    dataset_name = getattr(dataset, 'name', 'Unnamed Dataset')
     output_console.print(f"\n[bold magenta]{'═' * 80}[/bold magenta]")
     output_console.print(f"[bold magenta]📊 Dataset: {dataset_name}[/bold magenta]")
     output_console.print(f"[bold magenta]{'═' * 80}[/bold magenta]\n")
@@ -487,8 +597,7 @@ def visualize_dataset(dataset,
         num_messages = len(input_messages) if input_messages else 0
 
         # Check for expected output
-        has_expected = "✓" if (hasattr(case, 'expected_output') and case.expected_output) else "✗"
-        expected_style = "green" if has_expected == "✓" else "dim"
+        has_expected = hasattr(case, 'expected_output') and case.expected_output
 
         # Determine case type (original vs variant)
         case_type = "Variant" if "variant" in case_name.lower() else "Original"
@@ -497,7 +606,7 @@ def visualize_dataset(dataset,
             str(idx),
             case_name,
             str(num_messages),
-            Text(has_expected, style=expected_style),
+            _HAS_EXPECTED if has_expected else _NO_EXPECTED,
             case_type
         )
 
@@ -519,6 +628,34 @@ def visualize_dataset(dataset,
         total_messages += len(input_messages) if input_messages else 0
     output_console.print(f"  • Total messages: [cyan]{total_messages}[/cyan]")
 
+
+def visualize_dataset(dataset,
+                      show_details: bool = True,
+                      max_cases: int | None = None,
+                      console_instance: Console | None = None):
+    """
+    Visualize all cases in a dataset with an overview table and optional detailed views.
+
+    Args:
+        dataset: The dataset to visualize (pydantic_evals.Dataset or similar with .cases attribute)
+        show_details: If True, show detailed view of each case. If False, only show summary table.
+        max_cases: Optional limit on number of cases to visualize in detail (useful for large datasets)
+        console_instance: Optional Console instance to use (defaults to module console)
+    """
+    output_console = console_instance or console
+
+    # Get cases from dataset
+    cases = dataset.cases if hasattr(dataset, 'cases') else []
+
+    if not cases:
+        output_console.print("[yellow]⚠️  Dataset is empty - no cases to visualize[/yellow]")
+        return
+
+    # Write the overview in one go; detailed case views are flushed per case
+    dataset_name = getattr(dataset, 'name', 'Unnamed Dataset')
+    with output_console:
+        _print_dataset_overview(dataset_name, cases, output_console)
+
     # Show detailed views if requested
     if show_details:
         output_console.print(f"\n[bold cyan]{'─' * 80}[/bold cyan]")
@@ -650,44 +787,45 @@ def visualize_all_datasets_summary(
         output_console.print("[yellow]No datasets created yet.[/yellow]")
         return
 
-    output_console.print(f"\n[bold cyan]{'═' * 80}[/bold cyan]")
-    output_console.print("[bold cyan]📊 All Datasets Summary[/bold cyan]")
-    output_console.print(f"[bold cyan]{'═' * 80}[/bold cyan]\n")
-
-    # Create summary table
-    table = Table(title="Datasets Overview", show_header=True, header_style="bold magenta")
-    table.add_column("Dataset ID", style="cyan", no_wrap=True)
-    table.add_column("Name", style="green")
-    table.add_column("Original Case", style="yellow")
-    table.add_column("Variants", justify="right", style="blue")
-    table.add_column("Total Cases", justify="right", style="bold")
+    with output_console:
+        output_console.print(f"\n[bold cyan]{'═' * 80}[/bold cyan]")
+        output_console.print("[bold cyan]📊 All Datasets Summary[/bold cyan]")
+        output_console.print(f"[bold cyan]{'═' * 80}[/bold cyan]\n")
 
-    for dataset_id, config in datasets_dict.items():
-        num_variants = len(config.variants)
-        total_cases = 1 + num_variants  # original + variants
+        # Create summary table
+        table = Table(title="Datasets Overview", show_header=True, header_style="bold magenta")
+        table.add_column("Dataset ID", style="cyan", no_wrap=True)
+        table.add_column("Name", style="green")
+        table.add_column("Original Case", style="yellow")
+        table.add_column("Variants", justify="right", style="blue")
+        table.add_column("Total Cases", justify="right", style="bold")
 
-        table.add_row(
-            dataset_id,
-            config.name,
-            config.original_case.name,
-            str(num_variants),
-            str(total_cases)
-        )
+        for dataset_id, config in datasets_dict.items():
+            num_variants = len(config.variants)
+            total_cases = 1 + num_variants  # original + variants
+
+            table.add_row(
+                dataset_id,
+                config.name,
+                config.original_case.name,
+                str(num_variants),
+                str(total_cases)
+            )
 
-    output_console.print(table)
-    output_console.print()
+        output_console.print(table)
+        output_console.print()
 
-    if show_details:
-        output_console.print("[bold]Detailed Statistics:[/bold]\n")
-        for dataset_id, config in datasets_dict.items():
-            has_pre_hook = config.pre_task_hook is not None
-            has_post_hook = config.post_task_hook is not None
-
-            output_console.print(f"[cyan]{dataset_id}:[/cyan]")
-            output_console.print(f"  Name: {config.name}")
-            output_console.print(f"  Original: {config.original_case.name}")
-            output_console.print(f"  Variants: {len(config.variants)}")
-            output_console.print(f"  Total Cases: {1 + len(config.variants)}")
-            output_console.print(f"  Has Pre-Hook: {has_pre_hook}")
-            output_console.print(f"  Has Post-Hook: {has_post_hook}")
-            output_console.print()
+        if show_details:
+            output_console.print("[bold]Detailed Statistics:[/bold]\n")
+            for dataset_id, config in datasets_dict.items():
+                has_pre_hook = config.pre_task_hook is not None
+                has_post_hook = config.post_task_hook is not None
+
+                output_console.print(f"[cyan]{dataset_id}:[/cyan]")
+                output_console.print(f"  Name: {config.name}")
+                output_console.print(f"  Original: {config.original_case.name}")
+                output_console.print(f"  Variants: {len(config.variants)}")
+                output_console.print(f"  Total Cases: {1 + len(config.variants)}")
+                output_console.print(f"  Has Pre-Hook: {has_pre_hook}")
+                output_console.print(f"  Has Post-Hook: {has_post_hook}")
+                output_console.print()
@@ -1,27 +1,57 @@
-"""Utility functions and modules for meta_ally."""
-
-from meta_ally.ui.conversation_loader import (
-    list_loadable_conversations,
-    load_conversation_for_single_agent,
-)
-from meta_ally.ui.conversation_saver import (
-    list_saved_conversations,
-    load_conversation,
-    save_conversation,
-    save_conversation_html,
-)
-from meta_ally.ui.terminal_chat import start_chat_session
-from meta_ally.ui.visualization import (
-    console,
-    create_summary_table,
-    display_chat_message,
-    display_conversation_timeline,
-    display_orchestrator_message,
-    display_specialist_run,
-    show_side_by_side_comparison,
-    visualize_dataset,
-    visualize_single_case,
-)
+"""
+Utility functions and modules for meta_ally.
+
+The re-exported UI helpers are imported on first attribute access (PEP 562), so running a
+utility script such as ``meta_ally.util.generate_improved_tool_descriptions`` does not load
+the terminal chat and visualization stack.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from meta_ally.ui.conversation_loader import (
+        list_loadable_conversations,
+        load_conversation_for_single_agent,
+    )
+    from meta_ally.ui.conversation_saver import (
+        list_saved_conversations,
+        load_conversation,
+        save_conversation,
+        save_conversation_html,
+    )
+    from meta_ally.ui.terminal_chat import start_chat_session
+    from meta_ally.ui.visualization import (
+        console,
+        create_summary_table,
+        display_chat_message,
+        display_conversation_timeline,
+        display_orchestrator_message,
+        display_specialist_run,
+        show_side_by_side_comparison,
+        visualize_dataset,
+        visualize_single_case,
+    )
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {  # noqa: RUF067 - lazy re-export table
+    "list_loadable_conversations": "meta_ally.ui.conversation_loader",
+    "load_conversation_for_single_agent": "meta_ally.ui.conversation_loader",
+    "list_saved_conversations": "meta_ally.ui.conversation_saver",
+    "load_conversation": "meta_ally.ui.conversation_saver",
+    "save_conversation": "meta_ally.ui.conversation_saver",
+    "save_conversation_html": "meta_ally.ui.conversation_saver",
+    "start_chat_session": "meta_ally.ui.terminal_chat",
+    "console": "meta_ally.ui.visualization",
+    "create_summary_table": "meta_ally.ui.visualization",
+    "display_chat_message": "meta_ally.ui.visualization",
+    "display_conversation_timeline": "meta_ally.ui.visualization",
+    "display_orchestrator_message": "meta_ally.ui.visualization",
+    "display_specialist_run": "meta_ally.ui.visualization",
+    "show_side_by_side_comparison": "meta_ally.ui.visualization",
+    "visualize_dataset": "meta_ally.ui.visualization",
+    "visualize_single_case": "meta_ally.ui.visualization",
+}
 
 __all__ = [
     "console",
@@ -41,3 +71,31 @@ __all__ = [
     "visualize_dataset",
     "visualize_single_case",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import a re-exported helper on first access and cache it on the package.
+
+    Returns:
+        The requested attribute
+
+    Raises:
+        AttributeError: If the name is not exported by this package
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes including the lazily imported helpers.
+
+    Returns:
+        Sorted attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
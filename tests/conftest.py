@@ -0,0 +1,37 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import httpx
+import pytest
+
+from meta_ally.lib.openapi_to_tools import OpenAPIToolsLoader
+
+ALLY_CONFIG_DEV_OPENAPI_URL = "https://ally-config-ui.dev.copilot.aws.inform-cloud.io/openapi.json"
+
+
+@pytest.fixture(scope="session")
+def ally_config_api():
+    """
+    Skip tests that need the Ally Config dev API unless RUN_NETWORK_TESTS is set.
+
+    With the flag set they are still skipped when the API cannot be reached (HTTP errors still fail).
+    """
+    if not os.environ.get("RUN_NETWORK_TESTS"):
+        pytest.skip("network test, set RUN_NETWORK_TESTS=1 to run")
+    try:
+        httpx.head(ALLY_CONFIG_DEV_OPENAPI_URL, timeout=5)
+    except httpx.TransportError as e:
+        pytest.skip(f"Ally Config dev API not reachable: {e}")
+
+
+@pytest.fixture(scope="session")
+def ally_config_loader(ally_config_api):  # noqa: ARG001 - requested for its skip
+    """Ally Config dev API loader with its tools loaded once per test session (tests must not modify it)."""
+    loader = OpenAPIToolsLoader(
+        openapi_url=ALLY_CONFIG_DEV_OPENAPI_URL,
+        models_filename="ally_config_api_models.py",
+        regenerate_models=False
+    )
+    loader.load_tools()
+    return loader
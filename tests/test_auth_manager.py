@@ -0,0 +1,35 @@
+"""Tests for AuthManager token expiration handling."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from meta_ally.auth import auth_manager as auth_manager_module
+from meta_ally.auth.auth_manager import AuthManager
+
+IN_AN_HOUR = datetime.now() + timedelta(hours=1)
+
+
+@pytest.mark.parametrize(("expiration", "expected_refreshes"), [
+    (IN_AN_HOUR, 1),
+    (IN_AN_HOUR.timestamp(), 1),
+    (IN_AN_HOUR.isoformat(), 1),
+    (time.time() - 60, 2),  # Already expired
+    ("not a date", 2),  # Unparseable expirations refresh on every use
+    (None, 2),
+])
+def test_token_refreshed_only_when_expired(monkeypatch, expiration, expected_refreshes):
+    """The token is reused until its expiration, whatever type ai_core returns it as."""
+    calls = []
+
+    def fake_get_authorization_token(**_kwargs):
+        calls.append(1)
+        return f"token-{len(calls)}", expiration
+
+    monkeypatch.setattr(auth_manager_module, "get_authorization_token", fake_get_authorization_token)
+    manager = AuthManager(should_open_browser=False)
+
+    assert manager.get_token() == "token-1"
+    assert manager.get_token() == f"token-{expected_refreshes}"
+    assert len(calls) == expected_refreshes
@@ -9,15 +9,15 @@ from pydantic_ai.messages import ModelRequest, ModelResponse
 from meta_ally.eval.case_factory import CaseFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def case_factory():
-    """Fixture to provide a CaseFactory instance for tests."""
+    """Fixture to provide a CaseFactory shared by the module's tests (collected cases are never asserted on)."""
     return CaseFactory()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_conversation(case_factory):
-    """Fixture to provide a simple conversation for testing."""
+    """Fixture to provide a simple conversation for testing (shared, tests must not extend it)."""
     conversation = case_factory.create_conversation_turns(
     )
     conversation.add_user_message("Hello, how are you?")
@@ -26,9 +26,9 @@ def simple_conversation(case_factory):
     return conversation
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tool_conversation(case_factory):
-    """Fixture to provide a conversation with tool calls for testing."""
+    """Fixture to provide a conversation with tool calls for testing (shared, tests must not extend it)."""
     conversation = case_factory.create_conversation_turns()
     conversation.add_user_message("What's the weather like?")
     conversation.add_model_message("Let me check the weather for you.")
@@ -96,37 +96,13 @@ class TestConversationTurns:
         assert case.name == "Tool Call Conversation Test"
         assert len(case.input_messages) == 4
 
-    def test_invalid_conversation_start(self, case_factory):
-        """Test that conversations starting with model message fail validation."""
-        conversation = case_factory.create_conversation_turns()
-
-        # Start with model message instead of user message (invalid)
-        conversation.add_model_message("I'll start this conversation incorrectly")
-        conversation.add_user_message("This won't validate properly")
-
-        errors = conversation.validate()
-        assert len(errors) > 0, "Invalid conversation should have validation errors"
-        assert any("must start with a ModelRequest" in error for error in errors)
-
-    def test_invalid_conversation_end(self, case_factory):
-        """Test that conversations ending with model message fail validation."""
-        conversation = case_factory.create_conversation_turns()
-
-        conversation.add_user_message("Hello")
-        conversation.add_model_message("Hi there!")
-        # Missing final user message (invalid)
-
-        errors = conversation.validate()
-        assert len(errors) > 0, "Invalid conversation should have validation errors"
-        assert any("must end with a ModelRequest" in error for error in errors)
-
-    @pytest.mark.parametrize(("test_case", "expected_error"), [
-        ("empty_conversation", "must have at least one message"),
-        ("start_with_model", "must start with a ModelRequest"),
-        ("end_with_model", "must end with a ModelRequest"),
-        ("tool_without_response", "Tool calls without responses"),
+    @pytest.mark.parametrize(("test_case", "expected_errors"), [
+        ("empty_conversation", ("must have at least one message",)),
+        ("start_with_model", ("must start with a ModelRequest",)),
+        ("end_with_model", ("must end with a ModelRequest",)),
+        ("tool_without_response", ("Tool calls without responses", "search_1")),
     ])
-    def test_conversation_validation_errors(self, case_factory, test_case, expected_error):
+    def test_conversation_validation_errors(self, case_factory, test_case, expected_errors):
         """Test various conversation validation error scenarios."""
         conversation = case_factory.create_conversation_turns()
 
@@ -147,26 +123,10 @@ class TestConversationTurns:
 
         errors = conversation.validate()
         assert len(errors) > 0, f"Test case '{test_case}' should have validation errors"
-        assert any(
-            expected_error in error for error in errors
-        ), f"Expected error '{expected_error}' not found in {errors}"
-
-    def test_tool_call_without_response(self, case_factory):
-        """Test that tool calls without responses fail validation."""
-        conversation = case_factory.create_conversation_turns()
-
-        conversation.add_user_message("Search for something")
-        conversation.add_tool_call(
-            tool_call_id="search_1",
-            tool_name="search",
-            args={"query": "test"}
-        )
-        # Missing tool response
-
-        errors = conversation.validate()
-        assert len(errors) > 0, "Tool call without response should have validation errors"
-        assert any("Tool calls without responses" in error for error in errors)
-        assert any("search_1" in error for error in errors)
+        for expected_error in expected_errors:
+            assert any(
+                expected_error in error for error in errors
+            ), f"Expected error '{expected_error}' not found in {errors}"
 
     def test_single_tool_call_constraint(self, case_factory):
         """Test that multiple tool calls per response are prevented."""
@@ -200,15 +160,9 @@ class TestConversationTurns:
         errors = conversation.validate()
         assert not errors, f"Sequential tool calls should be valid, got errors: {errors}"
 
-    def test_conversation_turns_to_messages(self, case_factory):
+    def test_conversation_turns_to_messages(self, simple_conversation):
         """Test converting ConversationTurns to ModelMessage list."""
-        conversation = case_factory.create_conversation_turns()
-
-        conversation.add_user_message("Hello")
-        conversation.add_model_message("Hi there!")
-        conversation.add_user_message("How are you?")
-
-        messages = conversation.to_messages()
+        messages = simple_conversation.to_messages()
         assert len(messages) == 3
 
         # Check message types
@@ -216,28 +170,23 @@ class TestConversationTurns:
         assert isinstance(messages[1], ModelResponse)
         assert isinstance(messages[2], ModelRequest)
 
-    def test_preview_messages(self, case_factory):
+    def test_preview_messages(self, tool_conversation):
         """Test the preview_messages debugging functionality."""
-        conversation = case_factory.create_conversation_turns()
-
-        conversation.add_user_message("Hello")
-        conversation.add_model_message("Hi!")
-        conversation.add_tool_call("test_call", "test_tool", {"arg": "value"})
-        conversation.add_tool_response("test_call", "test_tool", "response")
-        conversation.add_user_message("Thanks")
-
-        preview = conversation.preview_messages()
+        preview = tool_conversation.preview_messages()
         assert len(preview) == 4, f"Expected 4 preview messages, got {len(preview)}"
 
         # Check that preview contains expected content
         preview_text = "\n".join(preview)
-        assert "UserPrompt: Hello" in preview_text
-        assert "Text: Hi!" in preview_text
-        assert "ToolCall[test_tool]" in preview_text
-        assert "ToolReturn[test_tool]" in preview_text
+        assert "UserPrompt: What's the weather like?" in preview_text
+        assert "Text: Let me check the weather" in preview_text
+        assert "ToolCall[get_weather]" in preview_text
+        assert "ToolReturn[get_weather]" in preview_text
 
-    def test_dataset_creation(self, case_factory):
+    def test_dataset_creation(self):
         """Test creating a dataset from multiple conversation cases."""
+        # Dedicated factory so cases collected by other tests do not end up in the dataset
+        case_factory = CaseFactory()
+
         # Create first conversation
         conversation1 = case_factory.create_conversation_turns()
         conversation1.add_user_message("Hello")
@@ -273,18 +222,12 @@ class TestConversationTurns:
         assert "Simple Chat" in case_names
         assert "Tool Search" in case_names
 
-    def test_case_factory_integration(self, case_factory):
+    def test_case_factory_integration(self, simple_conversation, case_factory):
         """Test that ConversationTurns integrates properly with CaseFactory."""
-        conversation = case_factory.create_conversation_turns()
-
-        conversation.add_user_message("Test message")
-        conversation.add_model_message("Test response")
-        conversation.add_user_message("Follow up")
-
         # Should be able to create case without errors
         case = case_factory.create_conversation_case(
             name="Integration Test",
-            conversation_turns=conversation,
+            conversation_turns=simple_conversation,
             expected_final_response="Expected response",
             description="Test integration",
             metadata={"test": True, "complexity": "simple"}
@@ -297,11 +240,3 @@ class TestConversationTurns:
         assert case.metadata["complexity"] == "simple"
         assert case.expected_output is not None
         assert case.expected_output.output_message == "Expected response"
-
-    def test_empty_conversation_validation(self, case_factory):
-        """Test that empty conversations fail validation."""
-        conversation = case_factory.create_conversation_turns()
-
-        errors = conversation.validate()
-        assert len(errors) > 0, "Empty conversation should have validation errors"
-        assert any("must have at least one message" in error for error in errors)
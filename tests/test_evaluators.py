@@ -1,6 +1,8 @@
 """Tests for evaluators module."""
 
 from datetime import datetime
+from functools import cache
+from types import SimpleNamespace
 
 import pytest
 from pydantic_ai.messages import ModelResponse
@@ -8,40 +10,41 @@ from pydantic_ai.messages import ModelResponse
 from meta_ally.eval.case_factory import ExpectedOutput, create_tool_call_part
 from meta_ally.eval.evaluators import ToolCallEvaluator
 
+# Stand-in for EvaluatorContext; evaluators only read expected_output and output
+MockContext = SimpleNamespace
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def evaluator_sets():
     """Evaluator with set-based comparison."""
     return ToolCallEvaluator(use_sets=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def evaluator_counts():
     """Evaluator with count-based comparison."""
     return ToolCallEvaluator(use_sets=False)
 
 
-def create_response(tool_names: list[str]) -> ModelResponse:
-    """Helper to create a ModelResponse with tool calls."""
+# Fixed timestamp so cached responses are identical however often they are requested
+RESPONSE_TIMESTAMP = datetime.now()
+
+
+@cache
+def create_response(*tool_names: str) -> ModelResponse:
+    """Helper to create a ModelResponse with tool calls (cached, callers must not modify it)."""
     parts = [create_tool_call_part(name, {"arg": "value"}) for name in tool_names]
-    return ModelResponse(parts=parts, timestamp=datetime.now())
+    return ModelResponse(parts=parts, timestamp=RESPONSE_TIMESTAMP)
 
 
-def create_expected(tool_names: list[str]) -> ExpectedOutput:
-    """Helper to create ExpectedOutput with tool calls."""
+@cache
+def create_expected(*tool_names: str) -> ExpectedOutput:
+    """Helper to create ExpectedOutput with tool calls (cached, callers must not modify it)."""
     return ExpectedOutput(
         tool_calls=[create_tool_call_part(name, {"arg": "value"}) for name in tool_names]
     )
 
 
-class MockContext:
-    """Mock EvaluatorContext for testing."""
-    def __init__(self, expected_output, output):
-        """Initialize mock context with expected and actual output."""
-        self.expected_output = expected_output
-        self.output = output
-
-
 class TestToolCallEvaluatorSets:
     """Test set-based comparison (default)."""
 
@@ -56,8 +59,8 @@ class TestToolCallEvaluatorSets:
     def test_tool_matching(self, evaluator_sets, expected_tools, actual_tools, expected_score):
         """Test various tool matching scenarios."""
         ctx = MockContext(
-            expected_output=create_expected(expected_tools),
-            output=[create_response(actual_tools)]
+            expected_output=create_expected(*expected_tools),
+            output=[create_response(*actual_tools)]
         )
         assert evaluator_sets.evaluate(ctx) == pytest.approx(expected_score)
 
@@ -73,7 +76,7 @@ class TestToolCallEvaluatorSets:
         """Test when no tools expected but some called."""
         ctx = MockContext(
             expected_output=ExpectedOutput(tool_calls=[]),
-            output=[create_response(["unexpected"])]
+            output=[create_response("unexpected")]
         )
         assert evaluator_sets.evaluate(ctx) == 0.0
 
@@ -81,14 +84,14 @@ class TestToolCallEvaluatorSets:
         """Test when expected_output is None."""
         ctx = MockContext(
             expected_output=None,
-            output=[create_response(["tool"])]
+            output=[create_response("tool")]
         )
         assert evaluator_sets.evaluate(ctx) == 0.0
 
     def test_empty_actual_messages(self, evaluator_sets):
         """Test with empty actual messages."""
         ctx = MockContext(
-            expected_output=create_expected(["tool"]),
+            expected_output=create_expected("tool"),
             output=[]
         )
         assert evaluator_sets.evaluate(ctx) == 0.0
@@ -96,8 +99,8 @@ class TestToolCallEvaluatorSets:
     def test_multiple_messages(self, evaluator_sets):
         """Test tools spread across multiple messages."""
         ctx = MockContext(
-            expected_output=create_expected(["a", "b"]),
-            output=[create_response(["a"]), create_response(["b"])]
+            expected_output=create_expected("a", "b"),
+            output=[create_response("a"), create_response("b")]
         )
         assert evaluator_sets.evaluate(ctx) == 1.0
 
@@ -105,10 +108,10 @@ class TestToolCallEvaluatorSets:
         """Test that model_messages takes priority over tool_calls."""
         ctx = MockContext(
             expected_output=ExpectedOutput(
-                model_messages=[create_response(["a"])],
+                model_messages=[create_response("a")],
                 tool_calls=[create_tool_call_part("b", {})]
             ),
-            output=[create_response(["a"])]
+            output=[create_response("a")]
         )
         assert evaluator_sets.evaluate(ctx) == 1.0
 
@@ -125,8 +128,8 @@ class TestToolCallEvaluatorCounts:
     def test_count_matching(self, evaluator_counts, expected_tools, actual_tools, expected_score):
         """Test count-based matching scenarios."""
         ctx = MockContext(
-            expected_output=create_expected(expected_tools),
-            output=[create_response(actual_tools)]
+            expected_output=create_expected(*expected_tools),
+            output=[create_response(*actual_tools)]
         )
         assert evaluator_counts.evaluate(ctx) == pytest.approx(expected_score)
 
@@ -138,7 +141,7 @@ class TestEdgeCases:
         """Test when tool_calls field is None."""
         ctx = MockContext(
             expected_output=ExpectedOutput(tool_calls=None),
-            output=[create_response(["tool"])]
+            output=[create_response("tool")]
         )
         assert evaluator_sets.evaluate(ctx) == 0.0
 
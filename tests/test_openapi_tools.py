@@ -18,17 +18,10 @@ from meta_ally.lib.openapi_to_tools import (
 
 
 @pytest.mark.anyio
-def test_openapi_tools_loader_basic():
+def test_openapi_tools_loader_basic(ally_config_loader):
     """Test basic OpenAPIToolsLoader functionality"""
-    # Initialize the loader with basic options
-    loader = OpenAPIToolsLoader(
-        openapi_url="https://ally-config-ui.dev.copilot.aws.inform-cloud.io/openapi.json",
-        models_filename="ally_config_api_models.py",  # Custom filename for models
-        regenerate_models=False  # Set to True to regenerate existing models file
-    )
-
-    # Load all tools
-    tools = loader.load_tools()
+    loader = ally_config_loader
+    tools = loader.tools
 
     # Assertions
     assert tools is not None, "Tools should not be None"
@@ -43,16 +36,9 @@ def test_openapi_tools_loader_basic():
 
 
 @pytest.mark.anyio
-async def test_openapi_tool_execution():
+async def test_openapi_tool_execution(ally_config_loader):
     """Test that we can execute a tool function"""
-    loader = OpenAPIToolsLoader(
-        openapi_url="https://ally-config-ui.dev.copilot.aws.inform-cloud.io/openapi.json",
-        models_filename="ally_config_api_models.py",
-        regenerate_models=False
-    )
-
-    # Load tools without using the tools variable
-    loader.load_tools()
+    loader = ally_config_loader
     example_tool = loader.get_tool_by_operation_id("list_models")
 
     assert example_tool is not None, "Should find the list_models tool"
@@ -93,6 +79,7 @@ def test_openapi_tools_loader_initialization():
     assert loader2.regenerate_models
 
 
+@pytest.mark.usefixtures("ally_config_api")
 def test_model_generation():
     """Test the model generation functionality"""
     # Test: Generate models with a custom filename
@@ -112,6 +99,7 @@ def test_model_generation():
         os.remove("test_models.py")
 
 
+@pytest.mark.usefixtures("ally_config_api")
 def test_model_generation_existing_file():
     """Test model generation behavior with existing files"""
     # Create a dummy file
@@ -143,6 +131,7 @@ def test_model_generation_existing_file():
 
 
 @pytest.mark.anyio
+@pytest.mark.usefixtures("ally_config_api")
 def test_custom_models_filename():
     """Test OpenAPIToolsLoader with custom models filename"""
     custom_filename = "pytest_custom_models.py"
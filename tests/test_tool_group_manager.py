@@ -0,0 +1,273 @@
+"""Tests for ToolGroupManager categorization and group lookups."""
+
+import copy
+
+import pytest
+from pydantic_ai import Tool
+
+from meta_ally.lib import openapi_to_tools
+from meta_ally.lib.openapi_to_tools import OpenAPIToolDependencies
+from meta_ally.tools.tool_group_manager import (
+    AIKnowledgeToolGroup,
+    AllyConfigToolGroup,
+    ToolGroupManager,
+)
+
+# Operation IDs and OpenAPI tags served by the fake loaders, per tool name prefix
+FAKE_OPERATIONS = {
+    "ai_knowledge_": {
+        "get_sources": ["sources"],
+        "list_collections": ["Collections"],
+        "list_documents": [],
+        "get_health": [],
+        "trigger_reindex": [],
+    },
+    "ally_config_": {
+        "list_copilots": ["copilots"],
+        "get_copilot_logs": [],
+        "get_copilot_sessions": [],
+        "delete_copilot_authorization": [],
+        "add_role": [],
+        "unrelated_operation": [],
+    },
+}
+
+
+async def fake_api_call(ctx, **kwargs):  # noqa: RUF029 - tool functions are awaited
+    """Stand-in tool function echoing its dependencies and arguments."""
+    return ctx.deps, kwargs
+
+
+class FakeOpenAPIToolsLoader:
+    """Offline replacement for OpenAPIToolsLoader serving FAKE_OPERATIONS."""
+
+    def __init__(self, tool_name_prefix: str = "", **_kwargs):
+        """Create tools for the operations registered under the prefix."""
+        self.tool_name_prefix = tool_name_prefix
+        operations = FAKE_OPERATIONS[tool_name_prefix]
+        self.tools = [
+            Tool.from_schema(
+                function=fake_api_call,
+                name=f"{tool_name_prefix}{operation_id}",
+                description=operation_id,
+                json_schema={"type": "object", "properties": {}},
+                takes_ctx=True,
+            )
+            for operation_id in operations
+        ]
+        self.tool_tags = {f"{tool_name_prefix}{op}": tags for op, tags in operations.items()}
+
+    def load_tools(self):
+        """Return the prepared tools."""
+        return self.tools
+
+    def get_tags_for_tool(self, tool_name: str) -> list[str]:
+        """Return the tags of a tool."""
+        return self.tool_tags.get(tool_name, [])
+
+    def get_tool_by_operation_id(self, operation_id: str):
+        """Return the tool for an unprefixed operation ID, if any."""
+        name = f"{self.tool_name_prefix}{operation_id}"
+        return next((tool for tool in self.tools if tool.name == name), None)
+
+    def create_dependencies(self, auth_manager=None) -> OpenAPIToolDependencies:
+        """Create dependencies bound to the auth manager."""
+        return OpenAPIToolDependencies(auth_manager=auth_manager)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """ToolGroupManager with both APIs loaded from the fake loader."""
+    monkeypatch.setattr(openapi_to_tools, "OpenAPIToolsLoader", FakeOpenAPIToolsLoader)
+    tool_manager = ToolGroupManager(auth_manager=object())
+    tool_manager.load_ai_knowledge_tools()
+    tool_manager.load_ally_config_tools()
+    return tool_manager
+
+
+def tool_names(tools) -> list[str]:
+    """Helper to extract tool names."""
+    return [tool.name for tool in tools]
+
+
+class TestCategorization:
+    """Test tag-based and fallback categorization."""
+
+    def test_ai_knowledge_groups(self, manager):
+        """Tags win over name patterns; untagged tools fall back to patterns."""
+        groups = manager.get_available_groups()["ai_knowledge_groups"]
+        assert groups["sources"] == ["ai_knowledge_get_sources"]
+        assert groups["collections"] == ["ai_knowledge_list_collections"]
+        assert groups["documents"] == ["ai_knowledge_list_documents"]
+        assert groups["status"] == ["ai_knowledge_get_health"]
+        assert groups["index-runs"] == ["ai_knowledge_trigger_reindex"]
+
+    def test_ally_config_groups(self, manager):
+        """Exact rule identifiers take precedence over keyword matches of earlier rules."""
+        groups = manager.get_available_groups()["ally_config_groups"]
+        assert groups["copilots"] == ["ally_config_list_copilots"]
+        assert groups["logs"] == ["ally_config_get_copilot_logs", "ally_config_get_copilot_sessions"]
+        assert groups["server authorization"] == ["ally_config_delete_copilot_authorization"]
+        assert groups["permissions"] == ["ally_config_add_role"]
+
+    def test_uncategorized_tools_only_in_all(self, manager):
+        """Tools matching no rule are only reachable through ALL."""
+        grouped = {name for names in manager.get_available_groups()["ally_config_groups"].values() for name in names}
+        assert "ally_config_unrelated_operation" not in grouped
+        assert "ally_config_unrelated_operation" in tool_names(
+            manager.get_tools_for_groups([AllyConfigToolGroup.ALL])
+        )
+
+
+class TestGetToolsForGroups:
+    """Test combining tool groups."""
+
+    @pytest.mark.parametrize("tool_groups", [
+        [AllyConfigToolGroup.ALL, AllyConfigToolGroup.LOGS],
+        [AllyConfigToolGroup.LOGS, AllyConfigToolGroup.ALL],
+        [AllyConfigToolGroup.LOGS, AllyConfigToolGroup.LOGS, AllyConfigToolGroup.ALL],
+    ])
+    def test_overlapping_groups_return_each_tool_once(self, manager, tool_groups):
+        """ALL combined with its sub-groups or repeated groups yields no duplicates."""
+        names = tool_names(manager.get_tools_for_groups(tool_groups))
+        assert sorted(names) == sorted(f"ally_config_{op}" for op in FAKE_OPERATIONS["ally_config_"])
+
+    def test_groups_across_apis(self, manager):
+        """Groups of both APIs are combined in request order."""
+        names = tool_names(manager.get_tools_for_groups([
+            AIKnowledgeToolGroup.SOURCES,
+            AllyConfigToolGroup.COPILOTS,
+            AIKnowledgeToolGroup.SOURCES,
+        ]))
+        assert names == ["ai_knowledge_get_sources", "ally_config_list_copilots"]
+
+
+class TestReload:
+    """Test reloading tools into an already populated manager."""
+
+    def test_unchanged_reload_points_groups_at_new_tools(self, manager):
+        """Reloading identical tools keeps the groups but references the fresh tool objects."""
+        # get_available_groups is cached, so compare against a snapshot rather than the same object
+        groups_before = copy.deepcopy(manager.get_available_groups())
+        old_logs = manager.get_tools_for_groups([AllyConfigToolGroup.LOGS])
+
+        manager.load_ally_config_tools()
+
+        new_logs = manager.get_tools_for_groups([AllyConfigToolGroup.LOGS])
+        assert manager.get_available_groups() == groups_before
+        assert tool_names(new_logs) == tool_names(old_logs)
+        assert all(new is not old for new, old in zip(new_logs, old_logs, strict=True))
+        assert set(map(id, new_logs)) <= set(map(id, manager.get_tools_for_groups([AllyConfigToolGroup.ALL])))
+
+    def test_changed_tags_recategorize(self, manager, monkeypatch):
+        """Reloading with different tags re-runs categorization."""
+        monkeypatch.setitem(FAKE_OPERATIONS["ally_config_"], "add_role", ["logs"])
+        manager.load_ally_config_tools()
+
+        groups = manager.get_available_groups()["ally_config_groups"]
+        assert "ally_config_add_role" in groups["logs"]
+        assert groups["permissions"] == []
+
+
+class TestOperationIndex:
+    """Test looking up tools by unprefixed operation ID."""
+
+    def test_keys_are_unprefixed_operation_ids(self, manager):
+        """Both APIs are indexed under their operation IDs without the tool name prefix."""
+        assert manager.get_tool_by_operation_id("get_sources").name == "ai_knowledge_get_sources"
+        assert manager.get_tool_by_operation_id("add_role").name == "ally_config_add_role"
+        assert manager.get_tool_by_operation_id("ally_config_add_role") is None
+
+    def test_duplicate_operation_id_prefers_ally_config(self, manager, monkeypatch):
+        """An operation ID served by both APIs resolves to the Ally Config tool."""
+        monkeypatch.setitem(FAKE_OPERATIONS["ai_knowledge_"], "list_copilots", [])
+        manager.load_ai_knowledge_tools()
+
+        assert manager.get_tool_by_operation_id("list_copilots").name == "ally_config_list_copilots"
+        assert manager.get_ai_knowledge_tool_by_operation_id("list_copilots").name == "ai_knowledge_list_copilots"
+
+    def test_truncated_names_fall_back_to_loaders(self, manager, monkeypatch):
+        """Operation IDs whose tool name was shortened are still found through the owning loader."""
+        tool = manager.get_ally_config_tool_by_operation_id("get_copilot_sessions")
+        monkeypatch.setattr(
+            manager._ally_config_loader,
+            "get_tool_by_operation_id",
+            lambda operation_id: tool if operation_id == "get_copilot_sessions_with_a_long_name" else None,
+        )
+
+        assert manager.get_tool_by_operation_id("get_copilot_sessions_with_a_long_name") is tool
+
+    def test_replacements_are_indexed(self, manager):
+        """After apply_tool_replacements the index points at the replacement tools."""
+        async def mock_list_copilots(_ctx):  # noqa: RUF029 - tool functions are awaited
+            return []
+
+        manager.apply_tool_replacements({"ally_config_list_copilots": mock_list_copilots})
+
+        assert manager.get_tool_by_operation_id("list_copilots").function is mock_list_copilots
+
+
+class TestLoadAllTools:
+    """Test loading both APIs concurrently."""
+
+    def test_load_all_tools_matches_sequential_loading(self, manager):
+        """Concurrent loading yields the same groups and operation lookups as loading one by one."""
+        concurrent = ToolGroupManager(auth_manager=object())
+        concurrent.load_all_tools()
+
+        assert concurrent.get_available_groups() == manager.get_available_groups()
+        assert concurrent.get_tool_by_operation_id("list_copilots").name == "ally_config_list_copilots"
+        assert concurrent.get_tool_by_operation_id("get_sources").name == "ai_knowledge_get_sources"
+
+
+class TestExecuteToolSafely:
+    """Test the dependencies handed to tools executed directly."""
+
+    @pytest.mark.anyio
+    async def test_generated_tools_share_dependencies(self, manager):
+        """Calls to the loader's own tool functions reuse one dependencies instance."""
+        first_deps, kwargs = await manager.execute_tool_safely("list_copilots", copilot="a")
+        second_deps, _ = await manager.execute_tool_safely("get_copilot_logs")
+
+        assert kwargs == {"copilot": "a"}
+        assert first_deps is second_deps
+        assert first_deps.auth_manager is manager._auth_manager
+
+    @pytest.mark.anyio
+    async def test_replaced_tools_get_fresh_dependencies(self, manager):
+        """Changes a replacement function makes to ctx.deps do not leak into later calls."""
+        async def set_project(ctx):  # noqa: RUF029 - tool functions are awaited
+            previous = ctx.deps.project_number
+            ctx.deps.project_number = "P-1"
+            return previous
+
+        manager.apply_tool_replacements({"ally_config_list_copilots": set_project})
+
+        assert await manager.execute_tool_safely("list_copilots") is None
+        assert await manager.execute_tool_safely("list_copilots") is None
+        deps, _ = await manager.execute_tool_safely("get_copilot_logs")
+        assert deps.project_number is None
+
+    @pytest.mark.anyio
+    async def test_swapped_auth_manager_rebuilds_dependencies(self, manager):
+        """Cached dependencies are rebuilt once they no longer match the current auth manager."""
+        old_deps, _ = await manager.execute_tool_safely("list_copilots")
+        manager._auth_manager = object()
+        new_deps, _ = await manager.execute_tool_safely("list_copilots")
+
+        assert new_deps is not old_deps
+        assert new_deps.auth_manager is manager._auth_manager
+
+    @pytest.mark.anyio
+    async def test_reload_drops_cached_dependencies(self, manager):
+        """Reloading an API discards the dependencies cached for its previous loader."""
+        old_loader = manager._ally_config_loader
+        old_deps, _ = await manager.execute_tool_safely("list_copilots")
+        ai_knowledge_deps, _ = await manager.execute_tool_safely("get_sources")
+
+        manager.load_ally_config_tools()
+        new_deps, _ = await manager.execute_tool_safely("list_copilots")
+
+        assert old_loader not in manager._dependencies_cache
+        assert new_deps is not old_deps
+        assert (await manager.execute_tool_safely("get_sources"))[0] is ai_knowledge_deps
@@ -6,15 +6,9 @@ Test for verifying that OpenAPI tools have proper parameter schemas
 from meta_ally.lib.openapi_to_tools import OpenAPIToolsLoader
 
 
-def test_tool_parameter_schemas():
+def test_tool_parameter_schemas(ally_config_loader):
     """Test that tools are created with proper parameter schemas"""
-    loader = OpenAPIToolsLoader(
-        openapi_url="https://ally-config-ui.dev.copilot.aws.inform-cloud.io/openapi.json",
-        models_filename="ally_config_api_models.py",
-        regenerate_models=False
-    )
-
-    tools = loader.load_tools()
+    tools = ally_config_loader.tools
 
     # Verify tools were created
     assert len(tools) > 0, "Should have created some tools"